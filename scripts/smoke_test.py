@@ -6,14 +6,16 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import select
+import selectors
 import signal
 import subprocess
 import sys
 import time
-from typing import Optional
+from typing import List
 
 DEFAULT_TIMEOUT = 5.0
+READ_CHUNK_SIZE = 64 * 1024
+START_EVENT_MARKER = b'"server.start"'
 
 
 def _parse_args() -> argparse.Namespace:
@@ -42,18 +44,28 @@ def _spawn_server() -> subprocess.Popen:
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
+        bufsize=0,
         env=env,
     )
 
 
-def _read_line(proc: subprocess.Popen, timeout: float) -> Optional[str]:
+def _read_lines(
+    proc: subprocess.Popen,
+    selector: selectors.BaseSelector,
+    pending: bytearray,
+    timeout: float,
+) -> List[bytes]:
     if proc.stderr is None:
-        return None
-    ready, _, _ = select.select([proc.stderr], [], [], timeout)
-    if not ready:
-        return None
-    return proc.stderr.readline()
+        return []
+    if not selector.select(timeout):
+        return []
+    chunk = os.read(proc.stderr.fileno(), READ_CHUNK_SIZE)
+    if not chunk:
+        return []
+    pending.extend(chunk)
+    *lines, rest = pending.split(b"\n")
+    pending[:] = rest
+    return [bytes(line) for line in lines]
 
 
 def _shutdown(proc: subprocess.Popen) -> None:
@@ -71,6 +83,10 @@ def main() -> int:
     deadline = time.monotonic() + args.timeout
 
     proc = _spawn_server()
+    selector = selectors.DefaultSelector()
+    if proc.stderr is not None:
+        selector.register(proc.stderr, selectors.EVENT_READ)
+    pending = bytearray()
     try:
         while time.monotonic() < deadline:
             if proc.poll() is not None:
@@ -78,29 +94,27 @@ def main() -> int:
                 return 2
 
             remaining = max(0.0, deadline - time.monotonic())
-            line = _read_line(proc, min(0.2, remaining))
-            if not line:
-                continue
+            for raw in _read_lines(proc, selector, pending, min(0.2, remaining)):
+                if args.verbose:
+                    print(raw.decode("utf-8", "replace").rstrip())
 
-            if args.verbose:
-                print(line.rstrip())
+                # Only lines mentioning the start event are worth a full JSON parse.
+                if START_EVENT_MARKER not in raw:
+                    continue
 
-            line = line.strip()
-            if not line:
-                continue
+                try:
+                    payload = json.loads(raw)
+                except ValueError:
+                    continue
 
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            if payload.get("event") == "server.start":
-                print("OK: server.start event received")
-                return 0
+                if payload.get("event") == "server.start":
+                    print("OK: server.start event received")
+                    return 0
 
         print(f"Timeout waiting for startup log after {args.timeout}s.", file=sys.stderr)
         return 1
     finally:
+        selector.close()
         _shutdown(proc)
 
 
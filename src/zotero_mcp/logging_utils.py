@@ -2,57 +2,121 @@
 
 from __future__ import annotations
 
+import atexit
 import contextlib
 import contextvars
-import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
 import time
-from datetime import datetime, timezone
-from typing import Any, Iterable, Mapping, MutableMapping, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback.
+    orjson = None  # type: ignore[assignment]
 
 REDACTED = "[REDACTED]"
+SERVICE_NAME = "zotero-mcp"
+LOGGER_NAME = "zotero_mcp"
+# Longer strings in logged tool arguments are replaced by a length marker.
+LOG_STRING_MAX_CHARS = 512
+
+# Payload keys shared by every event; the constants keep a single string object per key.
+_SERVICE = sys.intern("service")
+_TS = sys.intern("ts")
+_LEVEL = sys.intern("level")
+_EVENT = sys.intern("event")
+_CORRELATION_ID = sys.intern("correlation_id")
+
+_LEVEL_NAMES = {
+    logging.DEBUG: "DEBUG",
+    logging.INFO: "INFO",
+    logging.WARNING: "WARNING",
+    logging.ERROR: "ERROR",
+    logging.CRITICAL: "CRITICAL",
+}
 
 _correlation_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
     "zotero_mcp_correlation_id",
     default=None,
 )
 
-_SENSITIVE_KEYS = {
-    "api_key",
-    "apikey",
-    "authorization",
-    "body",
-    "cookie",
-    "set-cookie",
-    "secret",
-    "password",
-    "response",
-    "token",
-    "zotero-api-key",
-    "uploadkey",
-    "prefix",
-    "suffix",
-    "file_path",
-    "file_url",
-    "file_bytes_base64",
-    "file_bytes",
-    "filename",
-    "path",
-}
+# Plain threads have no context switches to track, so they keep the id in cheaper thread-local storage.
+_correlation_id_tls = threading.local()
+
+_SENSITIVE_KEYS = frozenset(
+    {
+        "api_key",
+        "apikey",
+        "authorization",
+        "body",
+        "cookie",
+        "set-cookie",
+        "secret",
+        "password",
+        "response",
+        "token",
+        "zotero-api-key",
+        "uploadkey",
+        "prefix",
+        "suffix",
+        "file_path",
+        "file_url",
+        "file_bytes_base64",
+        "file_bytes",
+        "filename",
+        "path",
+    }
+)
+
+# Spelled with "_", "-" and " " so the usual lowercase keys match without normalizing them first.
+_SENSITIVE_KEYS_EXPANDED = frozenset(
+    variant
+    for base in _SENSITIVE_KEYS
+    for variant in (base, base.replace("_", "-"), base.replace("_", " "), base.replace("-", "_"))
+)
+
+
+# [epoch second, formatted timestamp]; timestamps only have second resolution.
+_ts_cache: List[Any] = [None, ""]
 
 
 def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+    now = int(time.time())
+    cache = _ts_cache
+    if cache[0] != now:
+        cache[1] = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(now))
+        cache[0] = now
+    return cache[1]
+
+
+def _dumps(value: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # orjson rejects values stdlib json accepts (e.g. ints beyond 64 bits); logging must never fail a call.
+            pass
+    import json  # Deferred: only needed without orjson or for the rare payload orjson rejects.
+
+    return json.dumps(value, separators=(",", ":"), default=str)
 
 
 def _normalize_key(key: str) -> str:
     return key.lower().replace(" ", "_")
 
 
-def _is_sensitive_key(key: str) -> bool:
-    return _normalize_key(key) in _SENSITIVE_KEYS
+def _is_sensitive_key(key: str, sensitive: frozenset) -> bool:
+    if key in sensitive:
+        return True
+    # Lowercase keys without spaces are already in normalized form.
+    if key.islower() and " " not in key:
+        return False
+    return _normalize_key(key) in sensitive
 
 
 def _redact_string(value: str, secrets: Optional[Iterable[str]]) -> str:
@@ -63,29 +127,140 @@ def _redact_string(value: str, secrets: Optional[Iterable[str]]) -> str:
     return value
 
 
+def _push_sequence(
+    stack: List[Tuple[Any, Any, Any]],
+    pending: List[Tuple[Any, Any, type]],
+    parent: Any,
+    slot: Any,
+    value: Any,
+    kind: type,
+) -> None:
+    items: List[Any] = [None] * len(value)
+    parent[slot] = items
+    if kind is not list:
+        pending.append((parent, slot, kind))
+    for index, child in enumerate(value):
+        stack.append((items, index, child))
+
+
+def _needs_redaction(value: Any, secret_values: frozenset) -> bool:
+    sensitive = _SENSITIVE_KEYS_EXPANDED
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is str:
+            if item in secret_values:
+                return True
+        elif kind is dict:
+            for key, child in item.items():
+                if type(key) is not str:
+                    return True
+                if _is_sensitive_key(key, sensitive):
+                    return True
+                stack.append(child)
+        elif kind is list or kind is tuple:
+            stack.extend(item)
+        elif isinstance(item, (str, Mapping, list, tuple, set)):
+            # Let redact() normalize anything that is not a plain JSON container.
+            return True
+    return False
+
+
 def redact(value: Any, *, secrets: Optional[Iterable[str]] = None) -> Any:
-    if isinstance(value, Mapping):
-        output: MutableMapping[str, Any] = {}
-        for key, item in value.items():
-            key_str = str(key)
-            if _is_sensitive_key(key_str):
-                output[key_str] = REDACTED
-            else:
-                output[key_str] = redact(item, secrets=secrets)
-        return output
-    if isinstance(value, list):
-        return [redact(item, secrets=secrets) for item in value]
-    if isinstance(value, tuple):
-        return tuple(redact(item, secrets=secrets) for item in value)
-    if isinstance(value, set):
-        return {redact(item, secrets=secrets) for item in value}
-    if isinstance(value, str):
-        return _redact_string(value, secrets)
+    secret_values = frozenset(secret for secret in secrets if secret) if secrets else frozenset()
+    sensitive = _SENSITIVE_KEYS_EXPANDED
+    root: List[Any] = [None]
+    # Work items are (parent container, slot in parent, value to redact into that slot).
+    stack: List[Tuple[Any, Any, Any]] = [(root, 0, value)]
+    # Tuples and sets are built as lists first and converted once their children are filled in.
+    pending: List[Tuple[Any, Any, type]] = []
+    while stack:
+        parent, slot, item = stack.pop()
+        kind = type(item)
+        if kind is str:
+            parent[slot] = REDACTED if item in secret_values else item
+        elif kind is dict or (kind is not list and isinstance(item, Mapping)):
+            output: Dict[str, Any] = {}
+            parent[slot] = output
+            for key, child in item.items():
+                key_str = key if type(key) is str else str(key)
+                if _is_sensitive_key(key_str, sensitive):
+                    output[key_str] = REDACTED
+                else:
+                    output[key_str] = None
+                    stack.append((output, key_str, child))
+        elif kind is list or kind is tuple or kind is set:
+            _push_sequence(stack, pending, parent, slot, item, kind)
+        elif isinstance(item, str):
+            parent[slot] = _redact_string(item, secret_values)
+        elif isinstance(item, (list, tuple, set)):
+            base = list if isinstance(item, list) else tuple if isinstance(item, tuple) else set
+            _push_sequence(stack, pending, parent, slot, item, base)
+        else:
+            parent[slot] = item
+    # Containers are discovered parent-first, so converting in reverse finishes children first.
+    for parent, slot, kind in reversed(pending):
+        parent[slot] = kind(parent[slot])
+    return root[0]
+
+
+def elide_long_strings(value: Any, *, max_chars: int = LOG_STRING_MAX_CHARS) -> Any:
+    # Containers are only copied when something inside them was elided.
+    kind = type(value)
+    if kind is str:
+        return value if len(value) <= max_chars else f"<{len(value)} chars elided>"
+    if kind is dict:
+        output: Optional[Dict[Any, Any]] = None
+        for key, child in value.items():
+            elided = elide_long_strings(child, max_chars=max_chars)
+            if elided is not child:
+                if output is None:
+                    output = dict(value)
+                output[key] = elided
+        return value if output is None else output
+    if kind is list or kind is tuple:
+        items = [elide_long_strings(child, max_chars=max_chars) for child in value]
+        if all(elided is child for elided, child in zip(items, value)):
+            return value
+        return items if kind is list else tuple(items)
     return value
 
 
+class _JSONLineHandler(logging.StreamHandler):
+    """Write pre-serialized log lines to the stream's binary buffer with one write."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = record.getMessage() + "\n"
+            stream = self.stream
+            buffer = getattr(stream, "buffer", None)
+            if buffer is None:
+                stream.write(line)
+                stream.flush()
+            else:
+                buffer.write(line.encode("utf-8"))
+                buffer.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+@atexit.register
+def _stop_listener() -> None:
+    # Flushes queued records; also called before a new listener replaces the old one.
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def configure_logging() -> logging.Logger:
-    logger = logging.getLogger("zotero_mcp")
+    logger = logging.getLogger(LOGGER_NAME)
     if getattr(logger, "_configured", False):
         return logger
 
@@ -93,10 +268,16 @@ def configure_logging() -> logging.Logger:
     level = logging._nameToLevel.get(level_name, logging.INFO)
     logger.setLevel(level)
 
-    handler = logging.StreamHandler(stream=sys.stderr)
+    # Messages are already serialized JSON, so the handler skips formatting entirely.
+    handler = _JSONLineHandler(stream=sys.stderr)
     handler.setLevel(level)
-    handler.setFormatter(logging.Formatter("%(message)s"))
-    logger.handlers = [handler]
+    # Callers only enqueue records; a single listener thread owns the stderr writes.
+    global _listener
+    _stop_listener()
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+    _listener.start()
+    logger.handlers = [logging.handlers.QueueHandler(records)]
     logger.propagate = False
     logger._configured = True  # type: ignore[attr-defined]
     return logger
@@ -110,34 +291,72 @@ def log_event(
     secrets: Optional[Iterable[str]] = None,
     **fields: Any,
 ) -> None:
-    correlation_id = _correlation_id_var.get()
+    if not logger.isEnabledFor(level):
+        return
+    secret_values = frozenset(secret for secret in secrets if secret) if secrets else frozenset()
+    if _needs_redaction(fields, secret_values):
+        fields = redact(fields, secrets=secret_values)
+    log_event_raw(logger, level=level, event=event, **fields)
+
+
+# SAFETY: log_event_raw does not redact anything. Only call it with control-plane fields
+# (event names, versions, counts, durations) that can never carry credentials, paths or
+# user content; everything else must go through log_event.
+def log_event_raw(logger: logging.Logger, *, level: int, event: str, **fields: Any) -> None:
+    if not logger.isEnabledFor(level):
+        return
+    # A task or span id always wins over one left in the thread-local by synchronous code.
+    correlation_id = _correlation_id_var.get() or getattr(_correlation_id_tls, "value", None)
     payload = {
-        "ts": _utc_now_iso(),
-        "level": logging.getLevelName(level),
-        "event": event,
-        "service": "zotero-mcp",
+        _SERVICE: SERVICE_NAME,
+        _TS: _utc_now_iso(),
+        _LEVEL: _LEVEL_NAMES.get(level) or logging.getLevelName(level),
+        _EVENT: event,
     }
     if correlation_id:
-        payload["correlation_id"] = correlation_id
-    payload.update(fields)
-    redacted = redact(payload, secrets=secrets)
-    logger.log(level, json.dumps(redacted, separators=(",", ":")))
+        payload[_CORRELATION_ID] = correlation_id
+    if fields:
+        payload.update(fields)
+    logger.log(level, _dumps(payload))
 
 
 class Timer:
+    __slots__ = ("_start",)
+
     def __init__(self) -> None:
-        self._start = time.monotonic()
+        self._start = time.monotonic_ns()
 
     def elapsed_ms(self) -> int:
-        return int((time.monotonic() - self._start) * 1000)
+        return (time.monotonic_ns() - self._start) // 1_000_000
+
+
+class _ThreadCorrelationToken:
+    __slots__ = ("previous",)
 
+    def __init__(self, previous: Optional[str]) -> None:
+        self.previous = previous
 
-def set_correlation_id(value: Optional[str]) -> contextvars.Token[Optional[str]]:
+
+CorrelationToken = Union[contextvars.Token, _ThreadCorrelationToken]
+
+
+def set_correlation_id(value: Optional[str]) -> CorrelationToken:
+    import asyncio  # Deferred: only needed for the running-loop check, and costly to import at startup.
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        token = _ThreadCorrelationToken(getattr(_correlation_id_tls, "value", None))
+        _correlation_id_tls.value = value
+        return token
     return _correlation_id_var.set(value)
 
 
-def reset_correlation_id(token: contextvars.Token[Optional[str]]) -> None:
-    _correlation_id_var.reset(token)
+def reset_correlation_id(token: CorrelationToken) -> None:
+    if isinstance(token, _ThreadCorrelationToken):
+        _correlation_id_tls.value = token.previous
+    else:
+        _correlation_id_var.reset(token)
 
 
 @contextlib.contextmanager
@@ -3,31 +3,48 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import binascii
+import concurrent.futures
+import contextlib
+import itertools
 import logging
 import os
-import urllib.parse
-import uuid
-from typing import Any, Dict, List, Optional
+import secrets
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, NotRequired, Optional, Set, TypedDict
 
 import mcp.server.stdio
 import mcp.types as types
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import best_match
 from mcp.server.lowlevel import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 
+try:
+    import pybase64
+except ImportError:  # Optional speedup; binascii is the fallback.
+    pybase64 = None  # type: ignore[assignment]
+
 from . import __version__
-from .logging_utils import Timer, configure_logging, correlation_id_scope, log_event
+from .logging_utils import (
+    LOGGER_NAME,
+    Timer,
+    configure_logging,
+    correlation_id_scope,
+    elide_long_strings,
+    log_event,
+    log_event_raw,
+)
 from .zotero_client import (
     ZoteroError,
     add_item_to_collection,
     attach_arxiv_pdf,
     create_item,
+    exact_match_predicate,
     extract_exact_arxiv_query,
     extract_exact_doi_query,
-    filter_items_exact_match,
     get_item,
     get_item_template,
+    install_keepalive_opener,
     load_config_from_env,
     load_upload_max_bytes,
     list_collections,
@@ -41,11 +58,23 @@ from .zotero_client import (
 )
 
 server = Server("zotero-mcp")
-logger = configure_logging()
+# Handlers are installed by configure_logging() when the server starts, not at import.
+logger = logging.getLogger(LOGGER_NAME)
+
+# Blocking Zotero HTTP calls run on this many worker threads (see run()).
+HTTP_WORKER_THREADS = 16
+
+COLLECTION_PAGE_SIZE = 100
+COLLECTION_PAGE_CONCURRENCY = 8
+
+BATCH_TOOL_NAME = "zotero_batch_execute"
+BATCH_MAX_OPERATIONS = 50
+BATCH_DEFAULT_CONCURRENCY = 5
+BATCH_MAX_CONCURRENCY = 10
 
 DEFAULT_SORT = "relevance"
 FALLBACK_SORT = "dateModified"
-KNOWN_SORT_VALUES = [
+KNOWN_SORT_VALUES = (
     "relevance",
     "dateAdded",
     "dateModified",
@@ -58,7 +87,8 @@ KNOWN_SORT_VALUES = [
     "numChildren",
     "numTags",
     "language",
-]
+)
+_SORT_LOOKUP = {entry.lower(): entry for entry in KNOWN_SORT_VALUES}
 
 
 def _canonical_sort_value(value: str) -> Optional[str]:
@@ -67,8 +97,31 @@ def _canonical_sort_value(value: str) -> Optional[str]:
     value = value.strip()
     if not value:
         return None
-    lookup = {entry.lower(): entry for entry in KNOWN_SORT_VALUES}
-    return lookup.get(value.lower())
+    return _SORT_LOOKUP.get(value.lower())
+
+
+_ERROR_SCHEMA: Dict[str, Any] = {
+    "type": ["object", "null"],
+    "properties": {
+        "code": {"type": "string"},
+        "message": {"type": "string"},
+        "details": {"type": "object"},
+    },
+}
+
+
+def _output_schema(data_schema: Dict[str, Any]) -> Dict[str, Any]:
+    # Every tool returns the same {ok, data, error} envelope; only the data schema differs.
+    return {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "ok": {"type": "boolean"},
+            "data": data_schema,
+            "error": _ERROR_SCHEMA,
+        },
+        "required": ["ok", "data", "error"],
+    }
 
 
 def _tool_list() -> List[types.Tool]:
@@ -84,30 +137,16 @@ def _tool_list() -> List[types.Tool]:
                     "start": {"type": "integer", "minimum": 0, "default": 0},
                 },
             },
-            outputSchema={
-                "type": "object",
-                "additionalProperties": False,
-                "properties": {
-                    "ok": {"type": "boolean"},
-                    "data": {
-                        "type": ["object", "null"],
-                        "properties": {
-                            "collections": {"type": "array"},
-                            "total": {"type": "integer"},
-                            "next_start": {"type": "integer"},
-                        },
-                    },
-                    "error": {
-                        "type": ["object", "null"],
-                        "properties": {
-                            "code": {"type": "string"},
-                            "message": {"type": "string"},
-                            "details": {"type": "object"},
-                        },
+            outputSchema=_output_schema(
+                {
+                    "type": ["object", "null"],
+                    "properties": {
+                        "collections": {"type": "array"},
+                        "total": {"type": "integer"},
+                        "next_start": {"type": "integer"},
                     },
-                },
-                "required": ["ok", "data", "error"],
-            },
+                }
+            ),
         ),
         types.Tool(
             name="zotero_search_items",
@@ -129,62 +168,34 @@ def _tool_list() -> List[types.Tool]:
                 },
                 "required": ["query"],
             },
-            outputSchema={
-                "type": "object",
-                "additionalProperties": False,
-                "properties": {
-                    "ok": {"type": "boolean"},
-                    "data": {
-                        "type": ["object", "null"],
-                        "properties": {
-                            "items": {"type": "array"},
-                            "total": {"type": "integer"},
-                            "next_start": {"type": "integer"},
-                            "sort_used": {"type": "string"},
-                        },
-                    },
-                    "error": {
-                        "type": ["object", "null"],
-                        "properties": {
-                            "code": {"type": "string"},
-                            "message": {"type": "string"},
-                            "details": {"type": "object"},
-                        },
+            outputSchema=_output_schema(
+                {
+                    "type": ["object", "null"],
+                    "properties": {
+                        "items": {"type": "array"},
+                        "total": {"type": "integer"},
+                        "next_start": {"type": "integer"},
+                        "sort_used": {"type": "string"},
                     },
-                },
-                "required": ["ok", "data", "error"],
-            },
+                }
+            ),
         ),
         types.Tool(
             name="zotero_get_sort_values",
             description="Return the server's known Zotero sort values and fallbacks.",
             inputSchema={"type": "object", "additionalProperties": False, "properties": {}},
-            outputSchema={
-                "type": "object",
-                "additionalProperties": False,
-                "properties": {
-                    "ok": {"type": "boolean"},
-                    "data": {
-                        "type": ["object", "null"],
-                        "additionalProperties": False,
-                        "properties": {
-                            "values": {"type": "array", "items": {"type": "string"}},
-                            "default": {"type": "string"},
-                            "fallback": {"type": "string"},
-                        },
-                        "required": ["values", "default", "fallback"],
-                    },
-                    "error": {
-                        "type": ["object", "null"],
-                        "properties": {
-                            "code": {"type": "string"},
-                            "message": {"type": "string"},
-                            "details": {"type": "object"},
-                        },
+            outputSchema=_output_schema(
+                {
+                    "type": ["object", "null"],
+                    "additionalProperties": False,
+                    "properties": {
+                        "values": {"type": "array", "items": {"type": "string"}},
+                        "default": {"type": "string"},
+                        "fallback": {"type": "string"},
                     },
-                },
-                "required": ["ok", "data", "error"],
-            },
+                    "required": ["values", "default", "fallback"],
+                }
+            ),
         ),
         types.Tool(
             name="zotero_get_item",
@@ -197,28 +208,14 @@ def _tool_list() -> List[types.Tool]:
                 },
                 "required": ["item_key"],
             },
-            outputSchema={
-                "type": "object",
-                "additionalProperties": False,
-                "properties": {
-                    "ok": {"type": "boolean"},
-                    "data": {
-                        "type": ["object", "null"],
-                        "properties": {
-                            "item": {"type": "object"},
-                        },
+            outputSchema=_output_schema(
+                {
+                    "type": ["object", "null"],
+                    "properties": {
+                        "item": {"type": "object"},
                     },
-                    "error": {
-                        "type": ["object", "null"],
-                        "properties": {
-                            "code": {"type": "string"},
-                            "message": {"type": "string"},
-                            "details": {"type": "object"},
-                        },
-                    },
-                },
-                "required": ["ok", "data", "error"],
-            },
+                }
+            ),
         ),
         types.Tool(
             name="zotero_create_item",
@@ -256,30 +253,16 @@ def _tool_list() -> List[types.Tool]:
                 },
                 "required": ["item_type", "title"],
             },
-            outputSchema={
-                "type": "object",
-                "additionalProperties": False,
-                "properties": {
-                    "ok": {"type": "boolean"},
-                    "data": {
-                        "type": ["object", "null"],
-                        "properties": {
-                            "item_key": {"type": "string"},
-                            "version": {"type": "integer"},
-                            "item": {"type": "object"},
-                        },
+            outputSchema=_output_schema(
+                {
+                    "type": ["object", "null"],
+                    "properties": {
+                        "item_key": {"type": "string"},
+                        "version": {"type": "integer"},
+                        "item": {"type": "object"},
                     },
-                    "error": {
-                        "type": ["object", "null"],
-                        "properties": {
-                            "code": {"type": "string"},
-                            "message": {"type": "string"},
-                            "details": {"type": "object"},
-                        },
-                    },
-                },
-                "required": ["ok", "data", "error"],
-            },
+                }
+            ),
         ),
         types.Tool(
             name="zotero_upload_attachment",
@@ -306,33 +289,19 @@ def _tool_list() -> List[types.Tool]:
                     {"required": ["item_key", "file_bytes_base64", "filename"]},
                 ],
             },
-            outputSchema={
-                "type": "object",
-                "additionalProperties": False,
-                "properties": {
-                    "ok": {"type": "boolean"},
-                    "data": {
-                        "type": ["object", "null"],
-                        "properties": {
-                            "attachment_key": {"type": "string"},
-                            "parent_item_key": {"type": "string"},
-                            "title": {"type": "string"},
-                            "content_type": {"type": "string"},
-                            "size": {"type": "integer"},
-                            "version": {"type": "integer"},
-                        },
+            outputSchema=_output_schema(
+                {
+                    "type": ["object", "null"],
+                    "properties": {
+                        "attachment_key": {"type": "string"},
+                        "parent_item_key": {"type": "string"},
+                        "title": {"type": "string"},
+                        "content_type": {"type": "string"},
+                        "size": {"type": "integer"},
+                        "version": {"type": "integer"},
                     },
-                    "error": {
-                        "type": ["object", "null"],
-                        "properties": {
-                            "code": {"type": "string"},
-                            "message": {"type": "string"},
-                            "details": {"type": "object"},
-                        },
-                    },
-                },
-                "required": ["ok", "data", "error"],
-            },
+                }
+            ),
         ),
         types.Tool(
             name="zotero_attach_arxiv_pdf",
@@ -347,35 +316,21 @@ def _tool_list() -> List[types.Tool]:
                 },
                 "required": ["item_key", "arxiv_id"],
             },
-            outputSchema={
-                "type": "object",
-                "additionalProperties": False,
-                "properties": {
-                    "ok": {"type": "boolean"},
-                    "data": {
-                        "type": ["object", "null"],
-                        "properties": {
-                            "attachment_key": {"type": "string"},
-                            "parent_item_key": {"type": "string"},
-                            "title": {"type": "string"},
-                            "content_type": {"type": "string"},
-                            "size": {"type": "integer"},
-                            "version": {"type": "integer"},
-                            "arxiv_id": {"type": "string"},
-                            "pdf_url": {"type": "string"},
-                        },
-                    },
-                    "error": {
-                        "type": ["object", "null"],
-                        "properties": {
-                            "code": {"type": "string"},
-                            "message": {"type": "string"},
-                            "details": {"type": "object"},
-                        },
+            outputSchema=_output_schema(
+                {
+                    "type": ["object", "null"],
+                    "properties": {
+                        "attachment_key": {"type": "string"},
+                        "parent_item_key": {"type": "string"},
+                        "title": {"type": "string"},
+                        "content_type": {"type": "string"},
+                        "size": {"type": "integer"},
+                        "version": {"type": "integer"},
+                        "arxiv_id": {"type": "string"},
+                        "pdf_url": {"type": "string"},
                     },
-                },
-                "required": ["ok", "data", "error"],
-            },
+                }
+            ),
         ),
         types.Tool(
             name="zotero_add_item_to_collection",
@@ -390,110 +345,199 @@ def _tool_list() -> List[types.Tool]:
                 },
                 "required": ["item_key"],
             },
-            outputSchema={
+            outputSchema=_output_schema(
+                {
+                    "type": ["object", "null"],
+                    "properties": {
+                        "item_key": {"type": "string"},
+                        "collection_key": {"type": "string"},
+                    },
+                }
+            ),
+        ),
+        types.Tool(
+            name=BATCH_TOOL_NAME,
+            description="Run several Zotero tool calls in one request; each result uses the standard envelope.",
+            inputSchema={
                 "type": "object",
                 "additionalProperties": False,
                 "properties": {
-                    "ok": {"type": "boolean"},
-                    "data": {
-                        "type": ["object", "null"],
-                        "properties": {
-                            "item_key": {"type": "string"},
-                            "collection_key": {"type": "string"},
+                    "operations": {
+                        "type": "array",
+                        "minItems": 1,
+                        "maxItems": BATCH_MAX_OPERATIONS,
+                        "items": {
+                            "type": "object",
+                            "additionalProperties": False,
+                            "properties": {
+                                "tool": {"type": "string", "minLength": 1},
+                                "arguments": {"type": "object"},
+                            },
+                            "required": ["tool"],
                         },
                     },
-                    "error": {
-                        "type": ["object", "null"],
-                        "properties": {
-                            "code": {"type": "string"},
-                            "message": {"type": "string"},
-                            "details": {"type": "object"},
-                        },
+                    "max_concurrent": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": BATCH_MAX_CONCURRENCY,
+                        "default": BATCH_DEFAULT_CONCURRENCY,
                     },
+                    "stop_on_error": {"type": "boolean", "default": False},
                 },
-                "required": ["ok", "data", "error"],
+                "required": ["operations"],
             },
+            outputSchema=_output_schema(
+                {
+                    "type": ["object", "null"],
+                    "properties": {
+                        "results": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "ok": {"type": "boolean"},
+                                    "data": {},
+                                    "error": _ERROR_SCHEMA,
+                                },
+                                "required": ["ok", "data", "error"],
+                            },
+                        },
+                    },
+                }
+            ),
         ),
     ]
 
 
+# Tool definitions are static, so list_tools serves the same list for every request.
+_TOOLS: List[types.Tool] = _tool_list()
+# Input schemas are compiled once here; call_tool checks them instead of the SDK re-validating per call.
+_INPUT_SCHEMA_VALIDATORS: Dict[str, Draft202012Validator] = {
+    tool.name: Draft202012Validator(tool.inputSchema) for tool in _TOOLS
+}
+
+
 @server.list_tools()
 async def list_tools() -> List[types.Tool]:
-    return _tool_list()
+    return _TOOLS
+
+
+def _normalize_creator(creator: Dict[str, Any]) -> Dict[str, str]:
+    get = creator.get
+    entry: Dict[str, str] = {"creator_type": str(creator["creatorType"])}
+    name = get("name")
+    if name:
+        entry["name"] = str(name)
+    else:
+        first_name = get("firstName")
+        if first_name:
+            entry["first_name"] = str(first_name)
+        last_name = get("lastName")
+        if last_name:
+            entry["last_name"] = str(last_name)
+    return entry
+
+
+# Shapes of the normalized payloads returned to MCP clients; they stay plain dicts at runtime.
+class _NormalizedAttachment(TypedDict):
+    attachment_key: str
+    title: str
+    content_type: NotRequired[str]
+    size: NotRequired[int]
+
+
+class _NormalizedItem(TypedDict):
+    item_key: str
+    item_type: str
+    title: str
+    creators: List[Dict[str, str]]
+    date: str
+    doi: str
+    url: str
+    abstract: str
+    tags: List[str]
+    extra: str
+    version: int
+    attachments: NotRequired[List[_NormalizedAttachment]]
+
+
+class _NormalizedCollection(TypedDict):
+    collection_key: str
+    name: str
+    parent_key: str
+    version: int
+    num_items: NotRequired[int]
+
+
+# Shared stand-in for a missing or malformed "data"/"meta" object; only ever read.
+_EMPTY: Dict[str, Any] = {}
 
 
 def _normalize_creators(creators: Any) -> List[Dict[str, str]]:
-    if not isinstance(creators, list):
+    if not creators or not isinstance(creators, list):
         return []
-    normalized: List[Dict[str, str]] = []
-    for creator in creators:
-        if not isinstance(creator, dict):
-            continue
-        creator_type = creator.get("creatorType")
-        if not creator_type:
-            continue
-        entry: Dict[str, str] = {"creator_type": str(creator_type)}
-        if creator.get("name"):
-            entry["name"] = str(creator["name"])
-        else:
-            if creator.get("firstName"):
-                entry["first_name"] = str(creator["firstName"])
-            if creator.get("lastName"):
-                entry["last_name"] = str(creator["lastName"])
-        normalized.append(entry)
-    return normalized
+    return [
+        _normalize_creator(creator)
+        for creator in creators
+        if isinstance(creator, dict) and creator.get("creatorType")
+    ]
 
 
 def _normalize_tags(tags: Any) -> List[str]:
-    if not isinstance(tags, list):
+    if not tags or not isinstance(tags, list):
         return []
-    output: List[str] = []
-    for tag in tags:
-        if isinstance(tag, dict) and tag.get("tag"):
-            output.append(str(tag["tag"]))
-        elif isinstance(tag, str):
-            output.append(tag)
-    return output
+    return [
+        tag if isinstance(tag, str) else str(tag["tag"])
+        for tag in tags
+        if isinstance(tag, str) or (isinstance(tag, dict) and tag.get("tag"))
+    ]
 
 
-def _normalize_item(item: Dict[str, Any]) -> Dict[str, Any]:
-    data = item.get("data") if isinstance(item.get("data"), dict) else {}
+def _normalize_item(item: Dict[str, Any]) -> _NormalizedItem:
+    data = item.get("data")
+    get = (data if isinstance(data, dict) else _EMPTY).get
     return {
         "item_key": item.get("key", ""),
-        "item_type": data.get("itemType", ""),
-        "title": data.get("title", ""),
-        "creators": _normalize_creators(data.get("creators")),
-        "date": data.get("date", ""),
-        "doi": data.get("DOI", ""),
-        "url": data.get("url", ""),
-        "abstract": data.get("abstractNote", ""),
-        "tags": _normalize_tags(data.get("tags")),
-        "extra": data.get("extra", ""),
+        "item_type": get("itemType", ""),
+        "title": get("title", ""),
+        "creators": _normalize_creators(get("creators")),
+        "date": get("date", ""),
+        "doi": get("DOI", ""),
+        "url": get("url", ""),
+        "abstract": get("abstractNote", ""),
+        "tags": _normalize_tags(get("tags")),
+        "extra": get("extra", ""),
         "version": item.get("version", 0),
     }
 
 
-def _normalize_attachment(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    data = item.get("data") if isinstance(item.get("data"), dict) else {}
-    if data.get("itemType") != "attachment":
+def _normalize_attachment(item: Dict[str, Any]) -> Optional[_NormalizedAttachment]:
+    data = item.get("data")
+    if not isinstance(data, dict) or data.get("itemType") != "attachment":
         return None
-    attachment = {
+    attachment: _NormalizedAttachment = {
         "attachment_key": item.get("key", ""),
         "title": data.get("title", ""),
     }
     content_type = data.get("contentType")
     if content_type:
         attachment["content_type"] = content_type
-    size = data.get("fileSize") if data.get("fileSize") is not None else data.get("size")
+    size = data.get("fileSize")
+    if size is None:
+        size = data.get("size")
     if isinstance(size, int):
         attachment["size"] = size
     return attachment
 
 
-def _normalize_collection(collection: Dict[str, Any]) -> Dict[str, Any]:
-    data = collection.get("data") if isinstance(collection.get("data"), dict) else {}
-    meta = collection.get("meta") if isinstance(collection.get("meta"), dict) else {}
-    payload: Dict[str, Any] = {
+def _normalize_collection(collection: Dict[str, Any]) -> _NormalizedCollection:
+    data = collection.get("data")
+    if not isinstance(data, dict):
+        data = _EMPTY
+    meta = collection.get("meta")
+    if not isinstance(meta, dict):
+        meta = _EMPTY
+    payload: _NormalizedCollection = {
         "collection_key": collection.get("key", ""),
         "name": data.get("name", ""),
         "parent_key": data.get("parentCollection", ""),
@@ -505,31 +549,79 @@ def _normalize_collection(collection: Dict[str, Any]) -> Dict[str, Any]:
     return payload
 
 
-def _validate_search_args(args: Dict[str, Any]) -> Dict[str, Any]:
+def _require_object(args: Any) -> Dict[str, Any]:
     if not isinstance(args, dict):
         raise ZoteroError("ZOTERO_VALIDATION_ERROR", "Arguments must be an object.")
-    query = args.get("query")
-    if not isinstance(query, str) or not query.strip():
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "query is required and must be a non-empty string.")
-    limit = args.get("limit", 25)
+    return args
+
+
+def _required_string(args: Dict[str, Any], key: str) -> str:
+    value = args.get(key)
+    stripped = value.strip() if isinstance(value, str) else ""
+    if not stripped:
+        raise ZoteroError("ZOTERO_VALIDATION_ERROR", f"{key} is required and must be a non-empty string.")
+    return stripped
+
+
+def _optional_string(args: Dict[str, Any], key: str) -> Optional[str]:
+    value = args.get(key)
+    if value is None:
+        return None
+    stripped = value.strip() if isinstance(value, str) else ""
+    if not stripped:
+        raise ZoteroError("ZOTERO_VALIDATION_ERROR", f"{key} must be a non-empty string when provided.")
+    return stripped
+
+
+def _validate_limit(limit: Any) -> int:
     if not isinstance(limit, int):
         raise ZoteroError("ZOTERO_VALIDATION_ERROR", "limit must be an integer.")
     if limit < 1 or limit > 100:
         raise ZoteroError("ZOTERO_VALIDATION_ERROR", "limit must be between 1 and 100.")
-    sort = args.get("sort", DEFAULT_SORT)
-    if not isinstance(sort, str) or not sort:
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "sort must be a non-empty string.")
-    normalized_sort = _canonical_sort_value(sort)
-    if normalized_sort:
-        sort = normalized_sort
-    start = args.get("start", 0)
-    offset = args.get("offset")
+    return limit
+
+
+def _validate_start(start: Any) -> int:
     if start is None:
-        start = 0
+        return 0
     if not isinstance(start, int):
         raise ZoteroError("ZOTERO_VALIDATION_ERROR", "start must be an integer.")
     if start < 0:
         raise ZoteroError("ZOTERO_VALIDATION_ERROR", "start must be greater than or equal to 0.")
+    return start
+
+
+def _validate_tags(tags: Any, *, strip: bool) -> List[str]:
+    if not isinstance(tags, list):
+        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "tags must be an array of non-empty strings.")
+    seen: Set[str] = set()
+    output: List[str] = []
+    for tag in tags:
+        if not isinstance(tag, str):
+            raise ZoteroError("ZOTERO_VALIDATION_ERROR", "tags must be an array of non-empty strings.")
+        if strip:
+            tag = tag.strip()
+        if not tag:
+            raise ZoteroError("ZOTERO_VALIDATION_ERROR", "tags must be an array of non-empty strings.")
+        if tag not in seen:
+            seen.add(tag)
+            output.append(tag)
+    return output
+
+
+def _validate_search_args(args: Dict[str, Any]) -> Dict[str, Any]:
+    args = _require_object(args)
+    get = args.get
+    query = _required_string(args, "query")
+    limit = _validate_limit(get("limit", 25))
+    sort = get("sort", DEFAULT_SORT)
+    if not isinstance(sort, str) or not sort:
+        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "sort must be a non-empty string.")
+    normalized_sort = _canonical_sort_value(sort)
+    if normalized_sort:
+        sort = normalized_sort
+    start = _validate_start(get("start", 0))
+    offset = get("offset")
     if offset is not None:
         if not isinstance(offset, int):
             raise ZoteroError("ZOTERO_VALIDATION_ERROR", "offset must be an integer.")
@@ -539,85 +631,118 @@ def _validate_search_args(args: Dict[str, Any]) -> Dict[str, Any]:
             raise ZoteroError("ZOTERO_VALIDATION_ERROR", "Provide only one of start or offset.")
         if not start:
             start = offset
-    tags = args.get("tags")
+    tags = get("tags")
     if tags is not None:
-        if not isinstance(tags, list) or not all(isinstance(tag, str) and tag for tag in tags):
-            raise ZoteroError("ZOTERO_VALIDATION_ERROR", "tags must be an array of non-empty strings.")
-        tags = list(dict.fromkeys(tags))
-    return {"query": query.strip(), "limit": limit, "sort": sort, "start": start, "tags": tags}
+        tags = _validate_tags(tags, strip=False)
+    return {"query": query, "limit": limit, "sort": sort, "start": start, "tags": tags}
 
 
 def _validate_get_item_args(args: Dict[str, Any]) -> Dict[str, Any]:
-    if not isinstance(args, dict):
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "Arguments must be an object.")
-    item_key = args.get("item_key")
-    if not isinstance(item_key, str) or not item_key.strip():
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "item_key is required and must be a non-empty string.")
-    return {"item_key": item_key.strip()}
+    args = _require_object(args)
+    return {"item_key": _required_string(args, "item_key")}
 
 
 def _validate_list_collections_args(args: Dict[str, Any]) -> Dict[str, Any]:
-    if not isinstance(args, dict):
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "Arguments must be an object.")
-    limit = args.get("limit", 25)
-    if not isinstance(limit, int):
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "limit must be an integer.")
-    if limit < 1 or limit > 100:
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "limit must be between 1 and 100.")
-    start = args.get("start", 0)
-    if start is None:
-        start = 0
-    if not isinstance(start, int):
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "start must be an integer.")
-    if start < 0:
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "start must be greater than or equal to 0.")
-    return {"limit": limit, "start": start}
+    args = _require_object(args)
+    return {"limit": _validate_limit(args.get("limit", 25)), "start": _validate_start(args.get("start", 0))}
 
 
 def _validate_add_item_to_collection_args(args: Dict[str, Any]) -> Dict[str, Any]:
-    if not isinstance(args, dict):
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "Arguments must be an object.")
-    item_key = args.get("item_key")
-    if not isinstance(item_key, str) or not item_key.strip():
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "item_key is required and must be a non-empty string.")
-    collection_key = args.get("collection_key")
-    if collection_key is not None:
-        if not isinstance(collection_key, str) or not collection_key.strip():
-            raise ZoteroError("ZOTERO_VALIDATION_ERROR", "collection_key must be a non-empty string when provided.")
-        collection_key = collection_key.strip()
-    collection_name = args.get("collection_name")
-    if collection_name is not None:
-        if not isinstance(collection_name, str) or not collection_name.strip():
-            raise ZoteroError("ZOTERO_VALIDATION_ERROR", "collection_name must be a non-empty string when provided.")
-        collection_name = collection_name.strip()
+    args = _require_object(args)
+    item_key = _required_string(args, "item_key")
+    collection_key = _optional_string(args, "collection_key")
+    collection_name = _optional_string(args, "collection_name")
     if not collection_key and not collection_name:
         raise ZoteroError(
             "ZOTERO_VALIDATION_ERROR",
             "Provide collection_key or collection_name.",
         )
-    return {"item_key": item_key.strip(), "collection_key": collection_key, "collection_name": collection_name}
+    return {"item_key": item_key, "collection_key": collection_key, "collection_name": collection_name}
 
 
-def _resolve_collection_key_by_name(*, config, collection_name: str) -> str:
+def _validate_batch_execute_args(args: Dict[str, Any]) -> Dict[str, Any]:
+    args = _require_object(args)
+    get = args.get
+    operations = get("operations")
+    if not isinstance(operations, list) or not operations or len(operations) > BATCH_MAX_OPERATIONS:
+        raise ZoteroError(
+            "ZOTERO_VALIDATION_ERROR",
+            f"operations must be an array of 1 to {BATCH_MAX_OPERATIONS} tool calls.",
+        )
+    validated_operations: List[Dict[str, Any]] = []
+    for index, operation in enumerate(operations):
+        if not isinstance(operation, dict):
+            raise ZoteroError("ZOTERO_VALIDATION_ERROR", "operations entries must be objects.", {"index": index})
+        tool = operation.get("tool")
+        if tool == BATCH_TOOL_NAME or tool not in _TOOL_HANDLERS:
+            raise ZoteroError("ZOTERO_VALIDATION_ERROR", "tool must name a non-batch Zotero tool.", {"index": index})
+        arguments = operation.get("arguments")
+        if arguments is None:
+            arguments = {}
+        elif not isinstance(arguments, dict):
+            raise ZoteroError("ZOTERO_VALIDATION_ERROR", "arguments must be an object.", {"index": index})
+        validated_operations.append({"tool": tool, "arguments": arguments})
+    max_concurrent = get("max_concurrent", BATCH_DEFAULT_CONCURRENCY)
+    if not isinstance(max_concurrent, int) or max_concurrent < 1 or max_concurrent > BATCH_MAX_CONCURRENCY:
+        raise ZoteroError(
+            "ZOTERO_VALIDATION_ERROR",
+            f"max_concurrent must be an integer between 1 and {BATCH_MAX_CONCURRENCY}.",
+        )
+    stop_on_error = get("stop_on_error", False)
+    if not isinstance(stop_on_error, bool):
+        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "stop_on_error must be a boolean.")
+    return {"operations": validated_operations, "max_concurrent": max_concurrent, "stop_on_error": stop_on_error}
+
+
+def _collect_collection_matches(collections: List[Dict[str, Any]], normalized: str, matches: Set[str]) -> None:
+    matches.update(
+        key
+        for collection in collections
+        if isinstance(data := collection.get("data"), dict)
+        and isinstance(name := data.get("name"), str)
+        and name.casefold() == normalized
+        and isinstance(key := collection.get("key"), str)
+        and key
+    )
+
+
+async def _resolve_collection_key_by_name(*, config, collection_name: str) -> str:
     normalized = collection_name.casefold()
-    matches: List[str] = []
-    start = 0
-    while True:
-        collections, headers = list_collections(config=config, limit=100, start=start)
-        for collection in collections:
-            data = collection.get("data") if isinstance(collection.get("data"), dict) else {}
-            name = data.get("name", "")
-            if isinstance(name, str) and name.casefold() == normalized:
-                key = collection.get("key")
-                if isinstance(key, str) and key:
-                    matches.append(key)
-        next_start = parse_next_start(headers)
-        if next_start is None:
-            break
-        start = next_start
+    matches: Set[str] = set()
+    collections, headers = await asyncio.to_thread(
+        list_collections, config=config, limit=COLLECTION_PAGE_SIZE, start=0
+    )
+    _collect_collection_matches(collections, normalized, matches)
+    # A unique match must be confirmed against every page, but once the name is
+    # ambiguous no later page can change the outcome.
+    next_start = parse_next_start(headers) if len(matches) <= 1 else None
+    total = parse_total_results(headers)
+    if next_start is not None and total is not None:
+        # The total is known up front, so the remaining pages can be fetched concurrently.
+        semaphore = asyncio.Semaphore(COLLECTION_PAGE_CONCURRENCY)
+
+        async def fetch_page(start: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                page, _headers = await asyncio.to_thread(
+                    list_collections, config=config, limit=COLLECTION_PAGE_SIZE, start=start
+                )
+            return page
+
+        pages = await asyncio.gather(
+            *(fetch_page(start) for start in range(next_start, total, COLLECTION_PAGE_SIZE))
+        )
+        for page in pages:
+            _collect_collection_matches(page, normalized, matches)
+    else:
+        while next_start is not None:
+            collections, headers = await asyncio.to_thread(
+                list_collections, config=config, limit=COLLECTION_PAGE_SIZE, start=next_start
+            )
+            _collect_collection_matches(collections, normalized, matches)
+            next_start = parse_next_start(headers) if len(matches) <= 1 else None
     if not matches:
         raise ZoteroError("ZOTERO_NOT_FOUND", "Collection not found.", {"collection_name": collection_name})
-    unique_matches = sorted(set(matches))
+    unique_matches = sorted(matches)
     if len(unique_matches) > 1:
         raise ZoteroError(
             "ZOTERO_AMBIGUOUS_COLLECTION",
@@ -628,66 +753,73 @@ def _resolve_collection_key_by_name(*, config, collection_name: str) -> str:
 
 
 def _validate_create_args(args: Dict[str, Any]) -> Dict[str, Any]:
-    if not isinstance(args, dict):
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "Arguments must be an object.")
-    item_type = args.get("item_type")
-    if not isinstance(item_type, str) or not item_type.strip():
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "item_type is required and must be a non-empty string.")
-    title = args.get("title")
-    if not isinstance(title, str) or not title.strip():
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "title is required and must be a non-empty string.")
-    creators = args.get("creators")
+    args = _require_object(args)
+    get = args.get
+    item_type = _required_string(args, "item_type")
+    title = _required_string(args, "title")
+    creators = get("creators")
     if creators is not None:
         if not isinstance(creators, list):
             raise ZoteroError("ZOTERO_VALIDATION_ERROR", "creators must be an array.")
+        validated_creators: List[Dict[str, str]] = []
         for creator in creators:
             if not isinstance(creator, dict):
                 raise ZoteroError("ZOTERO_VALIDATION_ERROR", "creators entries must be objects.")
-            creator_type = creator.get("creator_type")
-            if not isinstance(creator_type, str) or not creator_type.strip():
+            creator_get = creator.get
+            creator_type = creator_get("creator_type")
+            creator_type = creator_type.strip() if isinstance(creator_type, str) else ""
+            if not creator_type:
                 raise ZoteroError("ZOTERO_VALIDATION_ERROR", "creator_type is required for each creator.")
-            has_name = bool(isinstance(creator.get("name"), str) and creator.get("name").strip())
-            has_first = bool(isinstance(creator.get("first_name"), str) and creator.get("first_name").strip())
-            has_last = bool(isinstance(creator.get("last_name"), str) and creator.get("last_name").strip())
-            if not has_name and not (has_first or has_last):
-                raise ZoteroError(
-                    "ZOTERO_VALIDATION_ERROR",
-                    "creators entries must include name or first_name/last_name.",
-                )
-    tags = args.get("tags")
+            entry = {"creator_type": creator_type}
+            name = creator_get("name")
+            if isinstance(name, str) and (name := name.strip()):
+                entry["name"] = name
+            else:
+                for field in ("first_name", "last_name"):
+                    value = creator_get(field)
+                    if isinstance(value, str) and (value := value.strip()):
+                        entry[field] = value
+                if len(entry) == 1:
+                    raise ZoteroError(
+                        "ZOTERO_VALIDATION_ERROR",
+                        "creators entries must include name or first_name/last_name.",
+                    )
+            validated_creators.append(entry)
+        creators = validated_creators
+    tags = get("tags")
     if tags is not None:
-        if not isinstance(tags, list) or not all(isinstance(tag, str) and tag.strip() for tag in tags):
-            raise ZoteroError("ZOTERO_VALIDATION_ERROR", "tags must be an array of non-empty strings.")
-        tags = list(dict.fromkeys([tag.strip() for tag in tags]))
+        tags = _validate_tags(tags, strip=True)
     return {
-        "item_type": item_type.strip(),
-        "title": title.strip(),
+        "item_type": item_type,
+        "title": title,
         "creators": creators,
-        "date": args.get("date"),
-        "doi": args.get("doi"),
-        "url": args.get("url"),
-        "abstract": args.get("abstract"),
+        "date": get("date"),
+        "doi": get("doi"),
+        "url": get("url"),
+        "abstract": get("abstract"),
         "tags": tags,
-        "extra": args.get("extra"),
+        "extra": get("extra"),
     }
 
 
-def _serialize_creators(creators: Optional[List[Dict[str, Any]]]) -> List[Dict[str, str]]:
+# Validated creator fields and their Zotero names; validation keeps either name or first/last.
+_CREATOR_FIELDS = (("name", "name"), ("first_name", "firstName"), ("last_name", "lastName"))
+
+
+def _serialize_creator(creator: Dict[str, str]) -> Dict[str, str]:
+    payload = {"creatorType": creator["creator_type"]}
+    for field, zotero_field in _CREATOR_FIELDS:
+        value = creator.get(field)
+        if value:
+            payload[zotero_field] = value
+    return payload
+
+
+def _serialize_creators(creators: Optional[List[Dict[str, str]]]) -> List[Dict[str, str]]:
     if not creators:
         return []
-    output: List[Dict[str, str]] = []
-    for creator in creators:
-        creator_type = str(creator.get("creator_type")).strip()
-        if creator.get("name"):
-            output.append({"creatorType": creator_type, "name": str(creator["name"]).strip()})
-            continue
-        payload: Dict[str, str] = {"creatorType": creator_type}
-        if creator.get("first_name"):
-            payload["firstName"] = str(creator["first_name"]).strip()
-        if creator.get("last_name"):
-            payload["lastName"] = str(creator["last_name"]).strip()
-        output.append(payload)
-    return output
+    serialize_creator = _serialize_creator
+    return [serialize_creator(creator) for creator in creators]
 
 
 def _extract_created_key(payload: Any) -> tuple[str, int]:
@@ -698,98 +830,119 @@ def _extract_created_key(payload: Any) -> tuple[str, int]:
             {"type": type(payload).__name__},
         )
     successful = payload.get("successful")
-    if isinstance(successful, dict):
-        for entry in successful.values():
-            if isinstance(entry, dict) and entry.get("key"):
-                return str(entry["key"]), int(entry.get("version", 0))
+    # Items are created one at a time, so the only entry is the new item.
+    if isinstance(successful, dict) and successful:
+        entry = next(iter(successful.values()))
+        if isinstance(entry, dict) and (key := entry.get("key")):
+            return str(key), int(entry.get("version", 0))
     raise ZoteroError("ZOTERO_UPSTREAM_ERROR", "Zotero create failed.", {"response": payload})
 
 
+def _b64decode(value: str) -> bytes:
+    if pybase64 is not None:
+        return pybase64.b64decode(value, validate=True)
+    return binascii.a2b_base64(value.encode("ascii"), strict_mode=True)
+
+
+# Upload sources as bit flags; a valid request sets exactly one of them.
+_SOURCE_FILE_PATH = 1
+_SOURCE_FILE_URL = 2
+_SOURCE_FILE_BYTES = 4
+_SINGLE_SOURCES = frozenset({_SOURCE_FILE_PATH, _SOURCE_FILE_URL, _SOURCE_FILE_BYTES})
+
+
 def _validate_upload_attachment_args(args: Dict[str, Any]) -> Dict[str, Any]:
-    if not isinstance(args, dict):
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "Arguments must be an object.")
-    item_key = args.get("item_key")
-    if not isinstance(item_key, str) or not item_key.strip():
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "item_key is required and must be a non-empty string.")
-    file_path = args.get("file_path")
-    file_url = args.get("file_url")
-    file_bytes_base64 = args.get("file_bytes_base64")
-    provided_sources = [file_path is not None, file_url is not None, file_bytes_base64 is not None]
-    if sum(provided_sources) != 1:
+    args = _require_object(args)
+    get = args.get
+    item_key = _required_string(args, "item_key")
+    file_path = get("file_path")
+    file_url = get("file_url")
+    file_bytes_base64 = get("file_bytes_base64")
+    source = (
+        (file_path is not None) * _SOURCE_FILE_PATH
+        | (file_url is not None) * _SOURCE_FILE_URL
+        | (file_bytes_base64 is not None) * _SOURCE_FILE_BYTES
+    )
+    if source not in _SINGLE_SOURCES:
         raise ZoteroError(
             "ZOTERO_VALIDATION_ERROR",
             "Provide exactly one of file_path, file_url, or file_bytes_base64.",
         )
+    # Check the cheap metadata fields first so they fail before any file access or base64 decoding.
+    title = _optional_string(args, "title")
+    content_type = get("content_type")
+    if content_type is not None:
+        if not isinstance(content_type, str):
+            raise ZoteroError("ZOTERO_VALIDATION_ERROR", "content_type must be a string when provided.")
+        # A blank content type means "infer it", same as omitting the field.
+        content_type = content_type.strip() or None
+    filename = _optional_string(args, "filename")
+    if file_bytes_base64 is not None and filename is None:
+        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "filename is required when using file_bytes_base64.")
     file_bytes: Optional[bytes] = None
-    if file_path is not None:
-        if not isinstance(file_path, str) or not file_path.strip():
-            raise ZoteroError("ZOTERO_VALIDATION_ERROR", "file_path must be a non-empty string when provided.")
-        file_path = file_path.strip()
+    if source == _SOURCE_FILE_PATH:
+        file_path = _optional_string(args, "file_path")
         validate_upload_file(file_path)
-    if file_url is not None:
-        if not isinstance(file_url, str) or not file_url.strip():
-            raise ZoteroError("ZOTERO_VALIDATION_ERROR", "file_url must be a non-empty string when provided.")
-        file_url = file_url.strip()
-        parsed = urllib.parse.urlparse(file_url)
-        if parsed.scheme not in ("http", "https"):
+    elif source == _SOURCE_FILE_URL:
+        file_url = _optional_string(args, "file_url")
+        # Only the scheme and the presence of a host matter here, so prefix checks replace a full URL parse.
+        scheme = file_url[:8].lower()
+        if scheme.startswith("https://"):
+            host_start = 8
+        elif scheme.startswith("http://"):
+            host_start = 7
+        else:
             raise ZoteroError("ZOTERO_VALIDATION_ERROR", "file_url must be http or https.")
-        if not parsed.netloc:
+        if host_start == len(file_url) or file_url[host_start] in "/?#":
             raise ZoteroError("ZOTERO_VALIDATION_ERROR", "file_url must include a host.")
-    if file_bytes_base64 is not None:
-        if not isinstance(file_bytes_base64, str) or not file_bytes_base64.strip():
+    else:
+        file_bytes_base64 = _optional_string(args, "file_bytes_base64")
+        max_bytes = load_upload_max_bytes()
+        # Every 4 data characters decode to 3 bytes and padding decodes to nothing, so counting only the
+        # unpadded characters gives the decoded size, even with surplus "=", without decoding oversized payloads.
+        decoded_size = len(file_bytes_base64.rstrip("=")) * 3 // 4
+        if decoded_size > max_bytes:
             raise ZoteroError(
                 "ZOTERO_VALIDATION_ERROR",
-                "file_bytes_base64 must be a non-empty string when provided.",
+                "file_bytes exceeds upload size limit.",
+                {"size": decoded_size, "max_bytes": max_bytes},
             )
         try:
-            file_bytes = base64.b64decode(file_bytes_base64, validate=True)
+            file_bytes = _b64decode(file_bytes_base64)
         except (ValueError, binascii.Error) as exc:
             raise ZoteroError("ZOTERO_VALIDATION_ERROR", "file_bytes_base64 must be valid base64.") from exc
-        max_bytes = load_upload_max_bytes()
-        if len(file_bytes) > max_bytes:
-            raise ZoteroError(
-                "ZOTERO_VALIDATION_ERROR",
-                "file_bytes exceeds upload size limit.",
-                {"size": len(file_bytes), "max_bytes": max_bytes},
-            )
-    title = args.get("title")
-    if title is not None and (not isinstance(title, str) or not title.strip()):
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "title must be a non-empty string when provided.")
-    content_type = args.get("content_type")
-    if content_type is not None and not isinstance(content_type, str):
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "content_type must be a string when provided.")
-    filename = args.get("filename")
-    if filename is not None and (not isinstance(filename, str) or not filename.strip()):
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "filename must be a non-empty string when provided.")
-    if file_bytes_base64 is not None and filename is None:
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "filename is required when using file_bytes_base64.")
-    resolved_content_type = content_type.strip() if isinstance(content_type, str) and content_type.strip() else None
     return {
-        "item_key": item_key.strip(),
+        "item_key": item_key,
         "file_path": file_path,
         "file_url": file_url,
         "file_bytes": file_bytes,
-        "filename": filename.strip() if isinstance(filename, str) and filename.strip() else None,
+        "filename": filename,
         "title": title,
-        "content_type": resolved_content_type,
+        "content_type": content_type,
     }
 
 
 def _validate_attach_arxiv_args(args: Dict[str, Any]) -> Dict[str, Any]:
-    if not isinstance(args, dict):
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "Arguments must be an object.")
-    item_key = args.get("item_key")
-    if not isinstance(item_key, str) or not item_key.strip():
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "item_key is required and must be a non-empty string.")
-    arxiv_id = args.get("arxiv_id")
-    if not isinstance(arxiv_id, str) or not arxiv_id.strip():
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "arxiv_id is required and must be a non-empty string.")
+    args = _require_object(args)
+    item_key = _required_string(args, "item_key")
+    arxiv_id = _required_string(args, "arxiv_id")
     if not parse_arxiv_id(arxiv_id):
         raise ZoteroError("ZOTERO_VALIDATION_ERROR", "arxiv_id must be a valid arXiv identifier or URL.")
-    title = args.get("title")
-    if title is not None and (not isinstance(title, str) or not title.strip()):
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "title must be a non-empty string when provided.")
-    return {"item_key": item_key.strip(), "arxiv_id": arxiv_id.strip(), "title": title}
+    title = _optional_string(args, "title")
+    return {"item_key": item_key, "arxiv_id": arxiv_id, "title": title}
+
+
+# Argument validators keyed by tool name; zotero_get_sort_values takes no arguments.
+_VALIDATORS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "zotero_list_collections": _validate_list_collections_args,
+    "zotero_search_items": _validate_search_args,
+    "zotero_get_item": _validate_get_item_args,
+    "zotero_create_item": _validate_create_args,
+    "zotero_upload_attachment": _validate_upload_attachment_args,
+    "zotero_attach_arxiv_pdf": _validate_attach_arxiv_args,
+    "zotero_add_item_to_collection": _validate_add_item_to_collection_args,
+    BATCH_TOOL_NAME: _validate_batch_execute_args,
+}
 
 
 def _ok(data: Any) -> Dict[str, Any]:
@@ -800,217 +953,235 @@ def _err(code: str, message: str, details: Optional[Dict[str, Any]] = None) -> D
     return {"ok": False, "data": None, "error": {"code": code, "message": message, "details": details or {}}}
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-    correlation_id = str(uuid.uuid4())
-    with correlation_id_scope(correlation_id):
-        timer = Timer()
-        log_event(logger, level=logging.INFO, event="tool.call", tool=name, args=arguments or {})
-        try:
-            if name == "zotero_list_collections":
-                validated = _validate_list_collections_args(arguments or {})
-                config = load_config_from_env()
-                raw_collections, headers = list_collections(config=config, **validated)
-                collections = [_normalize_collection(collection) for collection in raw_collections]
-                payload: Dict[str, Any] = {
-                    "collections": collections,
-                    "total": parse_total_results(headers) or len(collections),
-                }
-                next_start = parse_next_start(headers)
-                if next_start is not None:
-                    payload["next_start"] = next_start
-                response = _ok(payload)
-                log_event(
-                    logger,
-                    level=logging.INFO,
-                    event="tool.success",
-                    tool=name,
-                    duration_ms=timer.elapsed_ms(),
-                )
-                return response
-            if name == "zotero_search_items":
-                validated = _validate_search_args(arguments or {})
-                config = load_config_from_env()
-                sort_used = validated["sort"]
-                exact_doi = extract_exact_doi_query(validated["query"])
-                exact_arxiv = extract_exact_arxiv_query(validated["query"])
-                exact_arxiv_id = None
-                search_query = validated["query"]
-                if exact_doi:
-                    search_query = exact_doi
-                elif exact_arxiv:
-                    exact_arxiv_id = exact_arxiv[0] + (exact_arxiv[1] or "")
-                    search_query = exact_arxiv_id
-                try:
-                    raw_items, headers = search_items(
-                        config=config,
-                        query=search_query,
-                        limit=validated["limit"],
-                        sort=sort_used,
-                        start=validated["start"],
-                        tags=validated["tags"],
-                    )
-                except ZoteroError as exc:
-                    if sort_used == DEFAULT_SORT and exc.code == "ZOTERO_VALIDATION_ERROR":
-                        sort_used = FALLBACK_SORT
-                        log_event(
-                            logger,
-                            level=logging.WARNING,
-                            event="tool.sort_fallback",
-                            tool=name,
-                            fallback_sort=sort_used,
-                            reason=exc.message,
-                        )
-                        raw_items, headers = search_items(
-                            config=config,
-                            query=search_query,
-                            limit=validated["limit"],
-                            sort=sort_used,
-                            start=validated["start"],
-                            tags=validated["tags"],
-                        )
-                    else:
-                        raise
-                if exact_doi or exact_arxiv_id:
-                    raw_items = filter_items_exact_match(raw_items, doi=exact_doi, arxiv_id=exact_arxiv_id)
-                items = [_normalize_item(item) for item in raw_items]
-                payload: Dict[str, Any] = {
-                    "items": items,
-                    "total": len(items) if exact_doi or exact_arxiv_id else (parse_total_results(headers) or len(items)),
-                }
-                if sort_used != validated["sort"]:
-                    payload["sort_used"] = sort_used
-                if not (exact_doi or exact_arxiv_id):
-                    next_start = parse_next_start(headers)
-                    if next_start is not None:
-                        payload["next_start"] = next_start
-                response = _ok(payload)
-                log_event(
-                    logger,
-                    level=logging.INFO,
-                    event="tool.success",
-                    tool=name,
-                    duration_ms=timer.elapsed_ms(),
-                )
-                return response
-            if name == "zotero_get_sort_values":
-                response = _ok(
-                    {
-                        "values": list(KNOWN_SORT_VALUES),
-                        "default": DEFAULT_SORT,
-                        "fallback": FALLBACK_SORT,
-                    }
-                )
-                log_event(
-                    logger,
-                    level=logging.INFO,
-                    event="tool.success",
-                    tool=name,
-                    duration_ms=timer.elapsed_ms(),
-                )
-                return response
-            if name == "zotero_get_item":
-                validated = _validate_get_item_args(arguments or {})
-                config = load_config_from_env()
-                raw_item, _headers = get_item(config=config, **validated)
-                item = _normalize_item(raw_item)
-                children, _child_headers = list_item_children(config=config, **validated)
-                attachments: List[Dict[str, Any]] = []
-                for child in children:
-                    attachment = _normalize_attachment(child)
-                    if attachment:
-                        attachments.append(attachment)
-                item["attachments"] = attachments
-                response = _ok({"item": item})
-                log_event(
-                    logger,
-                    level=logging.INFO,
-                    event="tool.success",
-                    tool=name,
-                    duration_ms=timer.elapsed_ms(),
-                )
-                return response
-            if name == "zotero_create_item":
-                validated = _validate_create_args(arguments or {})
-                config = load_config_from_env()
-                template = get_item_template(config=config, item_type=validated["item_type"])
-                template["title"] = validated["title"]
-                creators = _serialize_creators(validated.get("creators"))
-                if creators:
-                    template["creators"] = creators
-                if validated.get("date"):
-                    template["date"] = str(validated["date"])
-                if validated.get("doi"):
-                    template["DOI"] = str(validated["doi"])
-                if validated.get("url"):
-                    template["url"] = str(validated["url"])
-                if validated.get("abstract"):
-                    template["abstractNote"] = str(validated["abstract"])
-                if validated.get("tags"):
-                    template["tags"] = [{"tag": tag} for tag in validated["tags"]]
-                if validated.get("extra"):
-                    template["extra"] = str(validated["extra"])
-                payload = create_item(config=config, item=template)
-                item_key, version = _extract_created_key(payload)
-                response = _ok({"item_key": item_key, "version": version, "item": template})
-                log_event(
-                    logger,
-                    level=logging.INFO,
-                    event="tool.success",
-                    tool=name,
-                    duration_ms=timer.elapsed_ms(),
-                )
-                return response
-            if name == "zotero_upload_attachment":
-                validated = _validate_upload_attachment_args(arguments or {})
-                config = load_config_from_env()
-                payload = upload_attachment(config=config, **validated)
-                response = _ok(payload)
-                log_event(
-                    logger,
-                    level=logging.INFO,
-                    event="tool.success",
-                    tool=name,
-                    duration_ms=timer.elapsed_ms(),
-                )
-                return response
-            if name == "zotero_attach_arxiv_pdf":
-                validated = _validate_attach_arxiv_args(arguments or {})
-                config = load_config_from_env()
-                payload = attach_arxiv_pdf(config=config, **validated)
-                response = _ok(payload)
-                log_event(
-                    logger,
-                    level=logging.INFO,
-                    event="tool.success",
-                    tool=name,
-                    duration_ms=timer.elapsed_ms(),
-                )
-                return response
-            if name == "zotero_add_item_to_collection":
-                validated = _validate_add_item_to_collection_args(arguments or {})
-                config = load_config_from_env()
-                collection_key = validated.get("collection_key")
-                if not collection_key:
-                    collection_key = _resolve_collection_key_by_name(
-                        config=config,
-                        collection_name=validated["collection_name"],
-                    )
-                add_item_to_collection(
-                    config=config,
-                    collection_key=collection_key,
-                    item_key=validated["item_key"],
-                )
-                response = _ok({"item_key": validated["item_key"], "collection_key": collection_key})
+async def _tool_list_collections(validated: Dict[str, Any]) -> Dict[str, Any]:
+    config = load_config_from_env()
+    raw_collections, headers = await asyncio.to_thread(list_collections, config=config, **validated)
+    normalize_collection = _normalize_collection
+    collections = [normalize_collection(collection) for collection in raw_collections]
+    payload: Dict[str, Any] = {
+        "collections": collections,
+        "total": parse_total_results(headers) or len(collections),
+    }
+    next_start = parse_next_start(headers)
+    if next_start is not None:
+        payload["next_start"] = next_start
+    return payload
+
+
+async def _tool_search_items(validated: Dict[str, Any]) -> Dict[str, Any]:
+    config = load_config_from_env()
+    sort_used = validated["sort"]
+    exact_doi = extract_exact_doi_query(validated["query"])
+    exact_arxiv = None if exact_doi else extract_exact_arxiv_query(validated["query"])
+    exact_arxiv_id = None
+    search_query = validated["query"]
+    if exact_doi:
+        search_query = exact_doi
+    elif exact_arxiv:
+        exact_arxiv_id = exact_arxiv[0] + (exact_arxiv[1] or "")
+        search_query = exact_arxiv_id
+    try:
+        raw_items, headers = await asyncio.to_thread(
+            search_items,
+            config=config,
+            query=search_query,
+            limit=validated["limit"],
+            sort=sort_used,
+            start=validated["start"],
+            tags=validated["tags"],
+        )
+    except ZoteroError as exc:
+        if sort_used == DEFAULT_SORT and exc.code == "ZOTERO_VALIDATION_ERROR":
+            sort_used = FALLBACK_SORT
+            log_event(
+                logger,
+                level=logging.WARNING,
+                event="tool.sort_fallback",
+                tool="zotero_search_items",
+                fallback_sort=sort_used,
+                reason=exc.message,
+            )
+            raw_items, headers = await asyncio.to_thread(
+                search_items,
+                config=config,
+                query=search_query,
+                limit=validated["limit"],
+                sort=sort_used,
+                start=validated["start"],
+                tags=validated["tags"],
+            )
+        else:
+            raise
+    normalize_item = _normalize_item
+    if exact_doi or exact_arxiv_id:
+        matches = exact_match_predicate(doi=exact_doi, arxiv_id=exact_arxiv_id)
+        items = [normalize_item(item) for item in raw_items if matches(item)]
+    else:
+        items = [normalize_item(item) for item in raw_items]
+    payload: Dict[str, Any] = {
+        "items": items,
+        "total": len(items) if exact_doi or exact_arxiv_id else (parse_total_results(headers) or len(items)),
+    }
+    if sort_used != validated["sort"]:
+        payload["sort_used"] = sort_used
+    if not (exact_doi or exact_arxiv_id):
+        next_start = parse_next_start(headers)
+        if next_start is not None:
+            payload["next_start"] = next_start
+    return payload
+
+
+async def _tool_get_sort_values(validated: Dict[str, Any]) -> Dict[str, Any]:
+    # Built per call so no caller can mutate a payload shared with later responses.
+    return {"values": list(KNOWN_SORT_VALUES), "default": DEFAULT_SORT, "fallback": FALLBACK_SORT}
+
+
+async def _tool_get_item(validated: Dict[str, Any]) -> Dict[str, Any]:
+    config = load_config_from_env()
+    (raw_item, _headers), (children, _child_headers) = await asyncio.gather(
+        asyncio.to_thread(get_item, config=config, **validated),
+        asyncio.to_thread(list_item_children, config=config, **validated),
+    )
+    item = _normalize_item(raw_item)
+    normalize_attachment = _normalize_attachment
+    item["attachments"] = [attachment for child in children if (attachment := normalize_attachment(child))]
+    return {"item": item}
+
+
+# Optional zotero_create_item arguments copied onto the item template as strings.
+_CREATE_TEMPLATE_FIELDS = (
+    ("date", "date"),
+    ("doi", "DOI"),
+    ("url", "url"),
+    ("abstract", "abstractNote"),
+    ("extra", "extra"),
+)
+
+
+async def _tool_create_item(validated: Dict[str, Any]) -> Dict[str, Any]:
+    config = load_config_from_env()
+    template = await asyncio.to_thread(get_item_template, config=config, item_type=validated["item_type"])
+    template["title"] = validated["title"]
+    get = validated.get
+    creators = get("creators")
+    if creators:
+        template["creators"] = _serialize_creators(creators)
+    for field, template_field in _CREATE_TEMPLATE_FIELDS:
+        value = get(field)
+        if value:
+            template[template_field] = str(value)
+    tags = get("tags")
+    if tags:
+        template["tags"] = [{"tag": tag} for tag in tags]
+    payload = await asyncio.to_thread(create_item, config=config, item=template)
+    item_key, version = _extract_created_key(payload)
+    return {"item_key": item_key, "version": version, "item": template}
+
+
+async def _tool_upload_attachment(validated: Dict[str, Any]) -> Dict[str, Any]:
+    config = load_config_from_env()
+    return await asyncio.to_thread(upload_attachment, config=config, **validated)
+
+
+async def _tool_attach_arxiv_pdf(validated: Dict[str, Any]) -> Dict[str, Any]:
+    config = load_config_from_env()
+    return await asyncio.to_thread(attach_arxiv_pdf, config=config, **validated)
+
+
+async def _tool_add_item_to_collection(validated: Dict[str, Any]) -> Dict[str, Any]:
+    config = load_config_from_env()
+    collection_key = validated.get("collection_key")
+    if not collection_key:
+        collection_key = await _resolve_collection_key_by_name(
+            config=config,
+            collection_name=validated["collection_name"],
+        )
+    await asyncio.to_thread(
+        add_item_to_collection,
+        config=config,
+        collection_key=collection_key,
+        item_key=validated["item_key"],
+    )
+    return {"item_key": validated["item_key"], "collection_key": collection_key}
+
+
+async def _tool_batch_execute(validated: Dict[str, Any]) -> Dict[str, Any]:
+    semaphore = asyncio.Semaphore(validated["max_concurrent"])
+    stop_on_error = validated["stop_on_error"]
+    stopped = False
+
+    async def run_operation(operation: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal stopped
+        async with semaphore:
+            # Operations already in flight finish; stop_on_error only keeps new ones from starting.
+            if stopped:
+                return _err("ZOTERO_BATCH_SKIPPED", "Skipped after an earlier operation failed.")
+            try:
+                data = await _dispatch_tool(operation["tool"], operation["arguments"])
+            except ZoteroError as exc:
+                stopped = stopped or stop_on_error
+                return _err(exc.code, exc.message, exc.details)
+            except Exception as exc:
+                # One operation's unexpected failure must not discard the other results.
+                stopped = stopped or stop_on_error
                 log_event(
                     logger,
-                    level=logging.INFO,
-                    event="tool.success",
-                    tool=name,
-                    duration_ms=timer.elapsed_ms(),
+                    level=logging.ERROR,
+                    event="tool.batch_operation_failed",
+                    tool=operation["tool"],
+                    error_type=type(exc).__name__,
                 )
-                return response
-            raise ValueError(f"Unknown tool: {name}")
+                return _err("ZOTERO_INTERNAL_ERROR", "Operation failed unexpectedly.", {"type": type(exc).__name__})
+        return _ok(data)
+
+    results = await asyncio.gather(*(run_operation(operation) for operation in validated["operations"]))
+    return {"results": list(results)}
+
+
+# Tool handlers keyed by tool name. Each receives validated arguments and returns the response data.
+_TOOL_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {
+    "zotero_list_collections": _tool_list_collections,
+    "zotero_search_items": _tool_search_items,
+    "zotero_get_sort_values": _tool_get_sort_values,
+    "zotero_get_item": _tool_get_item,
+    "zotero_create_item": _tool_create_item,
+    "zotero_upload_attachment": _tool_upload_attachment,
+    "zotero_attach_arxiv_pdf": _tool_attach_arxiv_pdf,
+    "zotero_add_item_to_collection": _tool_add_item_to_collection,
+    BATCH_TOOL_NAME: _tool_batch_execute,
+}
+
+
+async def _dispatch_tool(name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+    schema_validator = _INPUT_SCHEMA_VALIDATORS[name]
+    if not schema_validator.is_valid(args):
+        error = best_match(schema_validator.iter_errors(args))
+        raise ZoteroError(
+            "ZOTERO_VALIDATION_ERROR",
+            f"Input validation error: {error.message}",
+            {"path": list(error.absolute_path)},
+        )
+    validator = _VALIDATORS.get(name)
+    validated = validator(args) if validator is not None else {}
+    return await handler(validated)
+
+
+# Correlation ids only need to be unique within this process: a random per-process prefix plus a counter.
+_CORRELATION_ID_PREFIX = secrets.token_hex(4)
+_correlation_counter = itertools.count(1)
+
+
+@contextlib.contextmanager
+def _tool_span(name: str, arguments: Dict[str, Any]) -> Iterator[None]:
+    with correlation_id_scope(f"{_CORRELATION_ID_PREFIX}{next(_correlation_counter):08x}"):
+        timer = Timer()
+        if logger.isEnabledFor(logging.INFO):
+            log_event(logger, level=logging.INFO, event="tool.call", tool=name, args=elide_long_strings(arguments))
+        try:
+            yield
         except ZoteroError as exc:
             log_event(
                 logger,
@@ -1019,14 +1190,31 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
                 tool=name,
                 code=exc.code,
                 message=exc.message,
-                details=exc.details,
+                details=elide_long_strings(exc.details),
                 duration_ms=timer.elapsed_ms(),
             )
-            return _err(exc.code, exc.message, exc.details)
+            raise
+        log_event(logger, level=logging.INFO, event="tool.success", tool=name, duration_ms=timer.elapsed_ms())
+
+
+@server.call_tool(validate_input=False)
+async def call_tool(name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    args = arguments or {}
+    try:
+        with _tool_span(name, args):
+            data = await _dispatch_tool(name, args)
+    except ZoteroError as exc:
+        return _err(exc.code, exc.message, exc.details)
+    return _ok(data)
 
 
 async def run() -> None:
-    log_event(
+    configure_logging()
+    install_keepalive_opener()
+    asyncio.get_running_loop().set_default_executor(
+        concurrent.futures.ThreadPoolExecutor(max_workers=HTTP_WORKER_THREADS, thread_name_prefix="zotero-http")
+    )
+    log_event_raw(
         logger,
         level=logging.INFO,
         event="server.start",
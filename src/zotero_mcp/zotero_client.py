@@ -2,24 +2,37 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import http.client
 import json
 import logging
 import mimetypes
 import os
 import random
 import re
+import socket
+import ssl
+import stat
 import tempfile
+import threading
 import time
 import urllib.parse
 import urllib.request
+from collections import OrderedDict
+from collections.abc import Mapping
 from dataclasses import dataclass
 from email.utils import parsedate_to_datetime
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from .logging_utils import Timer, configure_logging, log_event
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback.
+    orjson = None  # type: ignore[assignment]
 
-logger = configure_logging()
+from .logging_utils import LOGGER_NAME, Timer, log_event
+
+logger = logging.getLogger(LOGGER_NAME)
 
 DEFAULT_UPLOAD_MAX_BYTES = 50 * 1024 * 1024
 
@@ -33,9 +46,24 @@ _DOI_PREFIXES = (
 _DOI_ID_RE = re.compile(r"^10\.\d{4,9}/[-._;()/:A-Z0-9]+$", re.IGNORECASE)
 _ARXIV_URL_RE = re.compile(r"(?:https?://)?(?:www\.)?arxiv\.org/(?:abs|pdf)/(.+)", re.IGNORECASE)
 _ARXIV_URL_FULL_RE = re.compile(r"^(?:https?://)?(?:www\.)?arxiv\.org/(?:abs|pdf)/(.+)$", re.IGNORECASE)
-_ARXIV_ID_RE = re.compile(r"^(?P<core>[a-z\\-]+/\\d{7}|\\d{4}\\.\\d{4,5})(?P<version>v\\d+)?$", re.IGNORECASE)
-_ARXIV_EXTRA_RE = re.compile(r"(?:^|\\s)arxiv(?:\\s*id)?\\s*[:=]\\s*(\\S+)", re.IGNORECASE)
-_DOI_EXTRA_RE = re.compile(r"(?:^|\\s)doi\\s*[:=]\\s*(\\S+)", re.IGNORECASE)
+_ARXIV_ID_RE = re.compile(r"^(?P<core>[a-z\-]+/\d{7}|\d{4}\.\d{4,5})(?P<version>v\d+)?$", re.IGNORECASE)
+# "arXiv: ..." / "arXiv ID = ..." and "DOI: ..." lines in an item's extra field, found in one scan.
+_EXTRA_ID_RE = re.compile(r"(?:^|\s)(?:(?P<arxiv>arxiv(?:\s*id)?)|doi)\s*[:=]\s*(?P<value>\S+)", re.IGNORECASE)
+# filename= or filename*= parameters, with the RFC 5987 UTF-8'' prefix left outside the captured name.
+_CONTENT_DISPOSITION_FILENAME_RE = re.compile(r"(?:^|;)\s*filename\*?\s*=\s*(?:utf-8'')?(?P<name>[^;]*)", re.IGNORECASE)
+
+
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
 
 class ZoteroError(RuntimeError):
     def __init__(self, code: str, message: str, details: Optional[Dict[str, Any]] = None) -> None:
@@ -71,24 +99,169 @@ def load_config_from_env() -> ZoteroConfig:
     user_id = os.environ.get("ZOTERO_USER_ID")
     api_base = os.environ.get("ZOTERO_API_BASE", "https://api.zotero.org")
     if not api_key or not user_id:
-        log_event(
-            logger,
-            level=logging.WARNING,
-            event="auth.missing",
-            missing=[key for key in ("ZOTERO_API_KEY", "ZOTERO_USER_ID") if not os.environ.get(key)],
-        )
+        missing = [key for key, value in (("ZOTERO_API_KEY", api_key), ("ZOTERO_USER_ID", user_id)) if not value]
+        log_event(logger, level=logging.WARNING, event="auth.missing", missing=missing)
         raise ZoteroError(
             "ZOTERO_AUTH_ERROR",
             "Zotero credentials missing. Set ZOTERO_API_KEY and ZOTERO_USER_ID.",
-            {"missing": [key for key in ("ZOTERO_API_KEY", "ZOTERO_USER_ID") if not os.environ.get(key)]},
+            {"missing": missing},
         )
+    return _build_config(api_key, user_id, api_base)
+
+
+# Keyed on the raw environment values, so a changed environment still yields a fresh config.
+@functools.lru_cache(maxsize=8)
+def _build_config(api_key: str, user_id: str, api_base: str) -> ZoteroConfig:
     return ZoteroConfig(api_key=api_key, user_id=user_id, api_base=api_base.rstrip("/"))
 
 
+class _KeepAliveResponse(http.client.HTTPResponse):
+    # Set when the response is closed before its body was read to the end; the
+    # connection still holds unread bytes and cannot carry another request.
+    abandoned = False
+
+    def close(self) -> None:
+        if self.fp is not None:
+            self.abandoned = True
+        super().close()
+
+
+# Idle pooled connections older than this are closed rather than reused; servers drop them anyway.
+_KEEPALIVE_IDLE_SECONDS = 30.0
+# Upper bound on idle connections each worker thread keeps (one per host).
+_KEEPALIVE_MAX_IDLE = 4
+# Only these requests may be resent after a reused connection turns out to be stale: a POST may
+# already have reached the server before the connection broke.
+_KEEPALIVE_RETRY_METHODS = frozenset(("GET", "HEAD"))
+
+
+def _discard_pooled(entry: Tuple[Any, _KeepAliveResponse, float]) -> None:
+    conn, last_response, _ = entry
+    # A response still being read owns the socket; it closes it when the caller is done.
+    if last_response.isclosed():
+        conn.close()
+
+
+# Keeps one idle connection per host and thread open for the next request instead of
+# urllib's connection-per-request, so repeat calls skip the TCP and TLS handshakes.
+class _KeepAliveMixin:
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._local = threading.local()
+
+    def _pooled_open(self, connection_class: Any, req: urllib.request.Request, **kwargs: Any) -> http.client.HTTPResponse:
+        if req._tunnel_host:
+            return self.do_open(connection_class, req, **kwargs)  # type: ignore[attr-defined]
+        host = req.host
+        if not host:
+            raise urllib.error.URLError("no host given")
+        connections = self._local.__dict__.setdefault("connections", {})
+        now = time.monotonic()
+        for stale_key in [k for k, entry in connections.items() if now - entry[2] > _KEEPALIVE_IDLE_SECONDS]:
+            _discard_pooled(connections.pop(stale_key))
+        key = (connection_class, host)
+        conn = None
+        entry = connections.pop(key, None)
+        if entry is not None:
+            pooled, last_response, _ = entry
+            if last_response.isclosed() and not last_response.abandoned:
+                conn = pooled
+            else:
+                _discard_pooled(entry)
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items() if k not in headers})
+        headers = {name.title(): value for name, value in headers.items()}
+        method = req.get_method()
+        # A reused connection may have been dropped by the server while idle; an idempotent request
+        # is retried once on a fresh connection.
+        retry_stale = method in _KEEPALIVE_RETRY_METHODS
+        while True:
+            reused = conn is not None
+            if conn is None:
+                conn = connection_class(host, timeout=req.timeout, **kwargs)
+                conn.response_class = _KeepAliveResponse
+            try:
+                if reused and req.timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+                    conn.timeout = req.timeout
+                    if conn.sock is not None:
+                        conn.sock.settimeout(req.timeout)
+                try:
+                    conn.request(
+                        method,
+                        req.selector,
+                        req.data,
+                        headers,
+                        encode_chunked=req.has_header("Transfer-encoding"),
+                    )
+                except ConnectionError:
+                    raise
+                except OSError as exc:
+                    raise urllib.error.URLError(exc) from exc
+                response = conn.getresponse()
+            except ConnectionError as exc:
+                conn.close()
+                if reused and retry_stale:
+                    conn = None
+                    continue
+                raise urllib.error.URLError(exc) from exc
+            except BaseException:
+                conn.close()
+                raise
+            break
+        response.url = req.get_full_url()
+        response.msg = response.reason
+        if not response.will_close:
+            connections[key] = (conn, response, now)
+            while len(connections) > _KEEPALIVE_MAX_IDLE:
+                _discard_pooled(connections.pop(next(iter(connections))))
+        return response
+
+
+class _KeepAliveHTTPHandler(_KeepAliveMixin, urllib.request.HTTPHandler):
+    def http_open(self, req: urllib.request.Request) -> http.client.HTTPResponse:
+        return self._pooled_open(http.client.HTTPConnection, req)
+
+
+class _KeepAliveHTTPSHandler(_KeepAliveMixin, urllib.request.HTTPSHandler):
+    def https_open(self, req: urllib.request.Request) -> http.client.HTTPResponse:
+        return self._pooled_open(http.client.HTTPSConnection, req, context=self._context)
+
+
+# Opener for the hosts this client talks to repeatedly (the Zotero API, Zotero's upload URLs and arXiv)
+# once install_keepalive_opener() has run. User-supplied file_url downloads and other urllib users in
+# the process keep the default opener.
+_keepalive_opener: Optional[urllib.request.OpenerDirector] = None
+
+
+def install_keepalive_opener() -> None:
+    global _keepalive_opener
+    # One TLS context is shared by every connection, so CA certificates load once.
+    https_handler = _KeepAliveHTTPSHandler(context=ssl.create_default_context())
+    _keepalive_opener = urllib.request.build_opener(_KeepAliveHTTPHandler(), https_handler)
+
+
+def _open_keepalive(request: urllib.request.Request, *, timeout: float) -> Any:
+    opener = _keepalive_opener
+    if opener is None:
+        return urllib.request.urlopen(request, timeout=timeout)
+    return opener.open(request, timeout=timeout)
+
+
 def _load_retry_config() -> RetryConfig:
-    max_attempts = int(os.environ.get("ZOTERO_RETRY_MAX_ATTEMPTS", "3"))
-    base_delay = float(os.environ.get("ZOTERO_RETRY_BASE_DELAY", "0.5"))
-    max_delay = float(os.environ.get("ZOTERO_RETRY_MAX_DELAY", "4.0"))
+    get = os.environ.get
+    return _parse_retry_config(
+        get("ZOTERO_RETRY_MAX_ATTEMPTS", "3"),
+        get("ZOTERO_RETRY_BASE_DELAY", "0.5"),
+        get("ZOTERO_RETRY_MAX_DELAY", "4.0"),
+    )
+
+
+# The env-derived configs below are parsed once per distinct set of raw values, like _build_config.
+@functools.lru_cache(maxsize=8)
+def _parse_retry_config(max_attempts_raw: str, base_delay_raw: str, max_delay_raw: str) -> RetryConfig:
+    max_attempts = int(max_attempts_raw)
+    base_delay = float(base_delay_raw)
+    max_delay = float(max_delay_raw)
     if max_attempts < 1:
         max_attempts = 1
     if base_delay < 0:
@@ -99,9 +272,19 @@ def _load_retry_config() -> RetryConfig:
 
 
 def _load_read_cache_config() -> ReadCacheConfig:
-    enabled = os.environ.get("ZOTERO_READ_CACHE", "0") == "1"
-    ttl_seconds = float(os.environ.get("ZOTERO_READ_CACHE_TTL", "30"))
-    max_entries = int(os.environ.get("ZOTERO_READ_CACHE_MAX", "128"))
+    get = os.environ.get
+    return _parse_read_cache_config(
+        get("ZOTERO_READ_CACHE", "0"),
+        get("ZOTERO_READ_CACHE_TTL", "30"),
+        get("ZOTERO_READ_CACHE_MAX", "128"),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_read_cache_config(enabled_raw: str, ttl_raw: str, max_entries_raw: str) -> ReadCacheConfig:
+    enabled = enabled_raw == "1"
+    ttl_seconds = float(ttl_raw)
+    max_entries = int(max_entries_raw)
     if ttl_seconds <= 0:
         ttl_seconds = 0.0
     if max_entries < 1:
@@ -110,7 +293,11 @@ def _load_read_cache_config() -> ReadCacheConfig:
 
 
 def load_upload_max_bytes() -> int:
-    raw = os.environ.get("ZOTERO_UPLOAD_MAX_BYTES")
+    return _parse_upload_max_bytes(os.environ.get("ZOTERO_UPLOAD_MAX_BYTES"))
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_upload_max_bytes(raw: Optional[str]) -> int:
     if not raw:
         return DEFAULT_UPLOAD_MAX_BYTES
     try:
@@ -141,9 +328,8 @@ def extract_exact_doi_query(query: str) -> Optional[str]:
         if lowered.startswith(prefix):
             candidate = raw[len(prefix) :].strip()
             break
-    if not candidate or any(ch.isspace() for ch in candidate):
-        return None
-    if not _DOI_ID_RE.match(candidate):
+    # The anchored pattern has no whitespace in its character class, so it also rejects embedded spaces.
+    if not candidate or not _DOI_ID_RE.match(candidate):
         return None
     return normalize_doi(candidate)
 
@@ -198,37 +384,49 @@ def parse_arxiv_id(value: str) -> Optional[Tuple[str, Optional[str]]]:
     return core, version
 
 
-def filter_items_exact_match(
-    items: Iterable[Dict[str, Any]],
+def exact_match_predicate(
     *,
     doi: Optional[str] = None,
     arxiv_id: Optional[str] = None,
-) -> List[Dict[str, Any]]:
+) -> Callable[[Dict[str, Any]], bool]:
     normalized_doi = normalize_doi(doi) if doi else None
     parsed_arxiv = parse_arxiv_id(arxiv_id) if arxiv_id else None
     if arxiv_id and not parsed_arxiv:
-        return []
-    output: List[Dict[str, Any]] = []
-    for item in items:
-        data = item.get("data") if isinstance(item.get("data"), dict) else {}
-        if normalized_doi:
-            if not _item_matches_doi(data, normalized_doi):
-                continue
-        if parsed_arxiv:
-            if not _item_matches_arxiv(data, parsed_arxiv):
-                continue
-        output.append(item)
-    return output
+        return lambda item: False
+
+    def matches(item: Dict[str, Any]) -> bool:
+        data = item.get("data")
+        if not isinstance(data, dict):
+            data = {}
+        if normalized_doi and not _item_matches_doi(data, normalized_doi):
+            return False
+        if parsed_arxiv and not _item_matches_arxiv(data, parsed_arxiv):
+            return False
+        return True
+
+    return matches
+
+
+def filter_items_exact_match(
+    items: Iterable[Dict[str, Any]],
+    *,
+    doi: Optional[str] = None,
+    arxiv_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    matches = exact_match_predicate(doi=doi, arxiv_id=arxiv_id)
+    return [item for item in items if matches(item)]
 
 
+# A normalized id is always a lowercase substring of the text it came from, so a plain substring test
+# rejects most non-matching items before any prefix stripping or regex scan.
 def _item_matches_doi(data: Dict[str, Any], normalized_doi: str) -> bool:
     doi = data.get("DOI")
-    if isinstance(doi, str) and normalize_doi(doi) == normalized_doi:
+    if isinstance(doi, str) and normalized_doi in doi.lower() and normalize_doi(doi) == normalized_doi:
         return True
     extra = data.get("extra")
-    if isinstance(extra, str):
-        for match in _DOI_EXTRA_RE.finditer(extra):
-            if normalize_doi(match.group(1)) == normalized_doi:
+    if isinstance(extra, str) and normalized_doi in extra.lower():
+        for match in _EXTRA_ID_RE.finditer(extra):
+            if match.group("arxiv") is None and normalize_doi(match.group("value")) == normalized_doi:
                 return True
     return False
 
@@ -237,11 +435,11 @@ def _item_matches_arxiv(data: Dict[str, Any], parsed: Tuple[str, Optional[str]])
     target_core, target_version = parsed
     candidates: List[str] = []
     archive_id = data.get("archiveID") or data.get("archiveId")
-    if isinstance(archive_id, str) and archive_id.strip():
+    if isinstance(archive_id, str) and target_core in archive_id.lower():
         candidates.append(archive_id)
     extra = data.get("extra")
-    if isinstance(extra, str):
-        candidates.extend(match.group(1) for match in _ARXIV_EXTRA_RE.finditer(extra))
+    if isinstance(extra, str) and target_core in extra.lower():
+        candidates.extend(match.group("value") for match in _EXTRA_ID_RE.finditer(extra) if match.group("arxiv"))
     for candidate in candidates:
         parsed_candidate = parse_arxiv_id(candidate)
         if not parsed_candidate:
@@ -256,44 +454,58 @@ def _item_matches_arxiv(data: Dict[str, Any], parsed: Tuple[str, Optional[str]])
     return False
 
 
+# Common attachment types, answered without loading the system mimetypes database.
+_CONTENT_TYPES_BY_EXTENSION = {
+    ".pdf": "application/pdf",
+    ".epub": "application/epub+zip",
+    ".html": "text/html",
+    ".htm": "text/html",
+    ".txt": "text/plain",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+}
+
+
 def infer_content_type(file_path: str) -> str:
-    guess, _ = mimetypes.guess_type(file_path)
-    if guess:
-        return guess
-    return "application/octet-stream"
+    extension = os.path.splitext(file_path)[1].lower()
+    return _CONTENT_TYPES_BY_EXTENSION.get(extension) or _content_type_for_extension(extension)
+
+
+# Other extensions fall back to mimetypes, memoized per extension.
+@functools.lru_cache(maxsize=128)
+def _content_type_for_extension(extension: str) -> str:
+    guess, _ = mimetypes.guess_type(f"file{extension}")
+    return guess or "application/octet-stream"
 
 
 def validate_upload_file(file_path: str) -> os.stat_result:
-    if not os.path.exists(file_path):
-        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "file_path does not exist.")
-    if not os.path.isfile(file_path):
+    # One stat() answers existence, file type and size; only readability needs a second call.
+    try:
+        file_stat = os.stat(file_path)
+    except (OSError, ValueError):
+        raise ZoteroError("ZOTERO_VALIDATION_ERROR", "file_path does not exist.") from None
+    if not stat.S_ISREG(file_stat.st_mode):
         raise ZoteroError("ZOTERO_VALIDATION_ERROR", "file_path must point to a local file.")
     if not os.access(file_path, os.R_OK):
         raise ZoteroError("ZOTERO_VALIDATION_ERROR", "file_path is not readable.")
-    stat = os.stat(file_path)
     max_bytes = load_upload_max_bytes()
-    if stat.st_size > max_bytes:
+    if file_stat.st_size > max_bytes:
         raise ZoteroError(
             "ZOTERO_VALIDATION_ERROR",
             "file_path exceeds upload size limit.",
-            {"size": stat.st_size, "max_bytes": max_bytes},
+            {"size": file_stat.st_size, "max_bytes": max_bytes},
         )
-    return stat
+    return file_stat
 
 
 def _filename_from_content_disposition(value: Optional[str]) -> Optional[str]:
     if not value:
         return None
-    for part in value.split(";"):
-        part = part.strip()
-        lowered = part.lower()
-        if lowered.startswith("filename*=") or lowered.startswith("filename="):
-            name = part.split("=", 1)[1].strip()
-            if name.lower().startswith("utf-8''"):
-                name = name[7:]
-            name = name.strip("\"'")
-            if name:
-                return name
+    for match in _CONTENT_DISPOSITION_FILENAME_RE.finditer(value):
+        name = match.group("name").strip().strip("\"'")
+        if name:
+            return name
     return None
 
 
@@ -316,6 +528,9 @@ def _read_response_bytes(response: Any, *, max_bytes: int, source_label: str) ->
                 f"{source_label} exceeds upload size limit.",
                 {"size": size, "max_bytes": max_bytes},
             )
+        if size is not None and not response.headers.get("Transfer-Encoding"):
+            # The body length is known and within the limit, so read it in one go without a join copy.
+            return response.read()
     chunks: List[bytes] = []
     total = 0
     while True:
@@ -387,7 +602,7 @@ def _fetch_arxiv_pdf_to_temp(arxiv_id_or_url: str) -> tuple[str, str, str]:
     pdf_url = _build_arxiv_pdf_url(arxiv_id)
     request = urllib.request.Request(pdf_url, headers={"User-Agent": "zotero-mcp"})
     try:
-        with urllib.request.urlopen(request, timeout=60) as response:
+        with _open_keepalive(request, timeout=60) as response:
             if response.status < 200 or response.status >= 300:
                 payload = response.read().decode("utf-8", errors="replace")
                 _raise_for_http_error(response.status, payload, response.headers)
@@ -402,7 +617,7 @@ def _fetch_arxiv_pdf_to_temp(arxiv_id_or_url: str) -> tuple[str, str, str]:
                         {"size": int(content_length), "max_bytes": max_bytes},
                     )
             content_type = response.headers.get("Content-Type", "")
-            payload_bytes = response.read()
+            temp_path = _write_pdf_response_to_temp(response, content_type)
     except urllib.error.HTTPError as exc:
         status = exc.code
         payload = exc.read().decode("utf-8", errors="replace") if exc.fp else ""
@@ -411,69 +626,101 @@ def _fetch_arxiv_pdf_to_temp(arxiv_id_or_url: str) -> tuple[str, str, str]:
     except urllib.error.URLError as exc:
         raise ZoteroError("ZOTERO_UPSTREAM_ERROR", "arXiv PDF request failed.", {"reason": str(exc)}) from exc
 
-    if not payload_bytes:
-        raise ZoteroError("ZOTERO_UPSTREAM_ERROR", "Empty arXiv PDF response.")
-
-    max_bytes = load_upload_max_bytes()
-    if len(payload_bytes) > max_bytes:
-        raise ZoteroError(
-            "ZOTERO_VALIDATION_ERROR",
-            "arXiv PDF exceeds upload size limit.",
-            {"size": len(payload_bytes), "max_bytes": max_bytes},
-        )
+    return temp_path, arxiv_id, pdf_url
 
-    is_pdf_header = payload_bytes.startswith(b"%PDF")
-    if "pdf" not in content_type.lower() and not is_pdf_header:
-        raise ZoteroError(
-            "ZOTERO_UPSTREAM_ERROR",
-            "arXiv response was not a PDF.",
-            {"content_type": content_type},
-        )
 
+def _write_pdf_response_to_temp(response: Any, content_type: str) -> str:
+    # The PDF is streamed into the temp file chunk by chunk instead of being held in memory whole.
+    max_bytes = load_upload_max_bytes()
     with tempfile.NamedTemporaryFile(prefix="arxiv_", suffix=".pdf", delete=False) as handle:
-        handle.write(payload_bytes)
         temp_path = handle.name
+        try:
+            total = 0
+            head = b""
+            while chunk := response.read(1024 * 1024):
+                if len(head) < 4:
+                    head += chunk[: 4 - len(head)]
+                total += len(chunk)
+                if total > max_bytes:
+                    raise ZoteroError(
+                        "ZOTERO_VALIDATION_ERROR",
+                        "arXiv PDF exceeds upload size limit.",
+                        {"size": total, "max_bytes": max_bytes},
+                    )
+                handle.write(chunk)
+            if not total:
+                raise ZoteroError("ZOTERO_UPSTREAM_ERROR", "Empty arXiv PDF response.")
+            if "pdf" not in content_type.lower() and head != b"%PDF":
+                raise ZoteroError(
+                    "ZOTERO_UPSTREAM_ERROR",
+                    "arXiv response was not a PDF.",
+                    {"content_type": content_type},
+                )
+        except BaseException:
+            handle.close()
+            os.unlink(temp_path)
+            raise
+    return temp_path
 
-    return temp_path, arxiv_id, pdf_url
 
+class _ResponseHeaders(Mapping):
+    # Read-only view of a response's headers plus its "status". Lookups go straight to the message,
+    # whose get() is already case-insensitive, instead of copying every header into a lowercased dict.
+    __slots__ = ("_headers", "_status")
 
-_READ_CACHE: Dict[str, Tuple[float, Any, Dict[str, str]]] = {}
+    def __init__(self, headers: Any, status: int) -> None:
+        self._headers = headers
+        self._status = str(status)
 
+    def __getitem__(self, key: str) -> str:
+        if key == "status":
+            return self._status
+        value = self._headers.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        yield "status"
+        for key in self._headers.keys():
+            yield key.lower()
+
+    def __len__(self) -> int:
+        return len(self._headers.keys()) + 1
 
-def _prune_cache(now: float, config: ReadCacheConfig) -> None:
-    if not _READ_CACHE:
-        return
-    expired = [key for key, (expires_at, _data, _headers) in _READ_CACHE.items() if expires_at <= now]
-    for key in expired:
-        _READ_CACHE.pop(key, None)
-    if len(_READ_CACHE) <= config.max_entries:
-        return
-    overflow = len(_READ_CACHE) - config.max_entries
-    for key in list(_READ_CACHE.keys())[:overflow]:
-        _READ_CACHE.pop(key, None)
 
+# Ordered from least to most recently used, so eviction pops from the front in O(1). Expired
+# entries are dropped lazily when looked up or evicted; the size bound keeps the rest in check.
+# Expiry uses the monotonic clock so wall-clock steps cannot extend or cut short a TTL.
+_READ_CACHE: "OrderedDict[str, Tuple[float, Any, Mapping[str, str]]]" = OrderedDict()
+# Tool calls run on worker threads, so cache reads and writes are serialized.
+_READ_CACHE_LOCK = threading.Lock()
 
-def _get_cached_response(cache_key: str, config: ReadCacheConfig) -> Optional[Tuple[Any, Dict[str, str]]]:
+
+def _get_cached_response(cache_key: str, config: ReadCacheConfig) -> Optional[Tuple[Any, Mapping[str, str]]]:
     if not config.enabled or config.ttl_seconds <= 0:
         return None
-    now = time.time()
-    _prune_cache(now, config)
-    entry = _READ_CACHE.get(cache_key)
-    if not entry:
-        return None
-    expires_at, data, headers = entry
-    if expires_at <= now:
-        _READ_CACHE.pop(cache_key, None)
-        return None
-    return data, dict(headers)
+    with _READ_CACHE_LOCK:
+        entry = _READ_CACHE.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, data, headers = entry
+        if expires_at <= time.monotonic():
+            del _READ_CACHE[cache_key]
+            return None
+        _READ_CACHE.move_to_end(cache_key)
+    return data, headers
 
 
-def _store_cached_response(cache_key: str, data: Any, headers: Dict[str, str], config: ReadCacheConfig) -> None:
+def _store_cached_response(cache_key: str, data: Any, headers: Mapping[str, str], config: ReadCacheConfig) -> None:
     if not config.enabled or config.ttl_seconds <= 0:
         return
-    now = time.time()
-    _prune_cache(now, config)
-    _READ_CACHE[cache_key] = (now + config.ttl_seconds, data, dict(headers))
+    entry = (time.monotonic() + config.ttl_seconds, data, headers)
+    with _READ_CACHE_LOCK:
+        _READ_CACHE[cache_key] = entry
+        _READ_CACHE.move_to_end(cache_key)
+        while len(_READ_CACHE) > config.max_entries:
+            _READ_CACHE.popitem(last=False)
 
 
 def _sleep_backoff(attempt: int, config: RetryConfig) -> None:
@@ -517,12 +764,11 @@ def _sleep_retry_after(seconds: Optional[float]) -> None:
     time.sleep(seconds)
 
 
+_RETRYABLE_STATUSES = frozenset((429, *range(500, 600)))
+
+
 def _should_retry_http(status: int) -> bool:
-    if status == 429:
-        return True
-    if 500 <= status <= 599:
-        return True
-    return False
+    return status in _RETRYABLE_STATUSES
 
 
 def _normalize_headers(headers: Optional[Any]) -> Dict[str, str]:
@@ -575,7 +821,7 @@ def _request_json_any(
     query: Optional[Iterable[Tuple[str, str]]] = None,
     body: Optional[Any] = None,
     extra_headers: Optional[Dict[str, str]] = None,
-) -> Tuple[Any, Dict[str, str]]:
+) -> Tuple[Any, Mapping[str, str]]:
     timer = Timer()
     url = f"{config.api_base}{path}"
     if query:
@@ -591,13 +837,17 @@ def _request_json_any(
         if isinstance(body, (bytes, bytearray)):
             data = bytes(body)
         else:
-            data = json.dumps(body, separators=(",", ":")).encode("utf-8")
+            data = _json_dumps(body)
             headers.setdefault("Content-Type", "application/json")
 
+    # Settings and per-request constants are bound once here rather than re-read on every attempt.
     retry_config = _load_retry_config()
+    max_attempts = retry_config.max_attempts
     cache_config = _load_read_cache_config()
     cache_key = f"{method}:{url}"
-    if method.upper() == "GET" and body is None:
+    cacheable = method.upper() == "GET" and body is None
+    secrets = [config.api_key]
+    if cacheable:
         cached = _get_cached_response(cache_key, cache_config)
         if cached is not None:
             log_event(
@@ -606,13 +856,13 @@ def _request_json_any(
                 event="zotero.cache_hit",
                 method=method,
                 path=path,
-                secrets=[config.api_key],
+                secrets=secrets,
             )
             return cached
 
     last_error: Optional[Exception] = None
     retry_after_seconds: Optional[float] = None
-    for attempt in range(1, retry_config.max_attempts + 1):
+    for attempt in range(1, max_attempts + 1):
         if retry_after_seconds is not None:
             log_event(
                 logger,
@@ -622,7 +872,7 @@ def _request_json_any(
                 path=path,
                 seconds=retry_after_seconds,
                 attempt=attempt,
-                secrets=[config.api_key],
+                secrets=secrets,
             )
             _sleep_retry_after(retry_after_seconds)
             retry_after_seconds = None
@@ -630,12 +880,11 @@ def _request_json_any(
             _sleep_backoff(attempt, retry_config)
         request = urllib.request.Request(url=url, method=method, headers=headers, data=data)
         try:
-            with urllib.request.urlopen(request, timeout=30) as response:
-                body_text = response.read().decode("utf-8")
-                payload = json.loads(body_text) if body_text else None
-                headers_out = {k.lower(): v for k, v in response.headers.items()}
-                headers_out["status"] = str(response.status)
-                if method.upper() == "GET" and body is None:
+            with _open_keepalive(request, timeout=30) as response:
+                raw = response.read()
+                payload = _json_loads(raw) if raw else None
+                headers_out = _ResponseHeaders(response.headers, response.status)
+                if cacheable:
                     _store_cached_response(cache_key, payload, headers_out, cache_config)
                 log_event(
                     logger,
@@ -646,7 +895,7 @@ def _request_json_any(
                     status=response.status,
                     attempt=attempt,
                     duration_ms=timer.elapsed_ms(),
-                    secrets=[config.api_key],
+                    secrets=secrets,
                 )
                 return payload, headers_out
         except urllib.error.HTTPError as exc:
@@ -662,11 +911,11 @@ def _request_json_any(
                 status=status,
                 attempt=attempt,
                 duration_ms=timer.elapsed_ms(),
-                secrets=[config.api_key],
+                secrets=secrets,
             )
             if status == 429:
                 retry_after_seconds = _parse_retry_after(details.get("retry_after"))
-            if _should_retry_http(status) and attempt < retry_config.max_attempts:
+            if _should_retry_http(status) and attempt < max_attempts:
                 last_error = exc
                 continue
             _raise_for_http_error(status, payload, exc.headers)
@@ -681,10 +930,10 @@ def _request_json_any(
                 status=None,
                 attempt=attempt,
                 duration_ms=timer.elapsed_ms(),
-                secrets=[config.api_key],
+                secrets=secrets,
             )
             retry_after_seconds = None
-            if attempt < retry_config.max_attempts:
+            if attempt < max_attempts:
                 last_error = exc
                 continue
             raise ZoteroError("ZOTERO_UPSTREAM_ERROR", "Zotero request failed.", {"reason": str(exc)}) from exc
@@ -700,7 +949,7 @@ def _request_json(
     method: str,
     path: str,
     query: Optional[Iterable[Tuple[str, str]]] = None,
-) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+) -> Tuple[List[Dict[str, Any]], Mapping[str, str]]:
     data, headers = _request_json_any(config=config, method=method, path=path, query=query)
     if data is None:
         return [], headers
@@ -719,124 +968,20 @@ def _request_json_object(
     method: str,
     path: str,
     query: Optional[Iterable[Tuple[str, str]]] = None,
-) -> Tuple[Dict[str, Any], Dict[str, str]]:
-    timer = Timer()
-    url = f"{config.api_base}{path}"
-    if query:
-        url = f"{url}?{_build_query(query)}"
-    headers = {
-        "Zotero-API-Key": config.api_key,
-        "Zotero-API-Version": "3",
-    }
-
-    retry_config = _load_retry_config()
-    cache_config = _load_read_cache_config()
-    cache_key = f"{method}:{url}"
-    if method.upper() == "GET":
-        cached = _get_cached_response(cache_key, cache_config)
-        if cached is not None:
-            data, headers_out = cached
-            if isinstance(data, dict):
-                log_event(
-                    logger,
-                    level=logging.DEBUG,
-                    event="zotero.cache_hit",
-                    method=method,
-                    path=path,
-                    secrets=[config.api_key],
-                )
-                return data, headers_out
-
-    last_error: Optional[Exception] = None
-    retry_after_seconds: Optional[float] = None
-    for attempt in range(1, retry_config.max_attempts + 1):
-        if retry_after_seconds is not None:
-            log_event(
-                logger,
-                level=logging.INFO,
-                event="zotero.retry_after",
-                method=method,
-                path=path,
-                seconds=retry_after_seconds,
-                attempt=attempt,
-                secrets=[config.api_key],
-            )
-            _sleep_retry_after(retry_after_seconds)
-            retry_after_seconds = None
-        else:
-            _sleep_backoff(attempt, retry_config)
-        request = urllib.request.Request(url=url, method=method, headers=headers)
-        try:
-            with urllib.request.urlopen(request, timeout=30) as response:
-                body = response.read().decode("utf-8")
-                data = json.loads(body) if body else {}
-                if not isinstance(data, dict):
-                    raise ZoteroError(
-                        "ZOTERO_UPSTREAM_ERROR",
-                        "Unexpected Zotero response format.",
-                        {"status": response.status},
-                    )
-                headers_out = {k.lower(): v for k, v in response.headers.items()}
-                if method.upper() == "GET":
-                    _store_cached_response(cache_key, data, headers_out, cache_config)
-                log_event(
-                    logger,
-                    level=logging.INFO,
-                    event="zotero.request",
-                    method=method,
-                    path=path,
-                    status=response.status,
-                    attempt=attempt,
-                    duration_ms=timer.elapsed_ms(),
-                    secrets=[config.api_key],
-                )
-                return data, headers_out
-        except urllib.error.HTTPError as exc:
-            status = exc.code
-            payload = exc.read().decode("utf-8") if exc.fp else ""
-            details = _build_http_error_details(status, payload, exc.headers)
-            log_event(
-                logger,
-                level=logging.WARNING,
-                event="zotero.request_error",
-                method=method,
-                path=path,
-                status=status,
-                attempt=attempt,
-                duration_ms=timer.elapsed_ms(),
-                secrets=[config.api_key],
-            )
-            if status == 429:
-                retry_after_seconds = _parse_retry_after(details.get("retry_after"))
-            if _should_retry_http(status) and attempt < retry_config.max_attempts:
-                last_error = exc
-                continue
-            _raise_for_http_error(status, payload, exc.headers)
-            raise ZoteroError("ZOTERO_UPSTREAM_ERROR", "Zotero request failed.", details) from exc
-        except urllib.error.URLError as exc:
-            log_event(
-                logger,
-                level=logging.WARNING,
-                event="zotero.request_error",
-                method=method,
-                path=path,
-                status=None,
-                attempt=attempt,
-                duration_ms=timer.elapsed_ms(),
-                secrets=[config.api_key],
-            )
-            retry_after_seconds = None
-            if attempt < retry_config.max_attempts:
-                last_error = exc
-                continue
-            raise ZoteroError("ZOTERO_UPSTREAM_ERROR", "Zotero request failed.", {"reason": str(exc)}) from exc
-
-    if last_error:
-        raise ZoteroError("ZOTERO_UPSTREAM_ERROR", "Zotero request failed.", {"reason": str(last_error)})
-    raise ZoteroError("ZOTERO_UPSTREAM_ERROR", "Zotero request failed.", {"reason": "unknown"})
+) -> Tuple[Dict[str, Any], Mapping[str, str]]:
+    data, headers = _request_json_any(config=config, method=method, path=path, query=query)
+    if data is None:
+        return {}, headers
+    if not isinstance(data, dict):
+        raise ZoteroError(
+            "ZOTERO_UPSTREAM_ERROR",
+            "Unexpected Zotero response format.",
+            {"status": headers.get("status")},
+        )
+    return data, headers
 
 
-def parse_total_results(headers: Dict[str, str]) -> Optional[int]:
+def parse_total_results(headers: Mapping[str, str]) -> Optional[int]:
     for key in ("total-results", "totalresults"):
         if key in headers:
             try:
@@ -846,7 +991,7 @@ def parse_total_results(headers: Dict[str, str]) -> Optional[int]:
     return None
 
 
-def parse_next_start(headers: Dict[str, str]) -> Optional[int]:
+def parse_next_start(headers: Mapping[str, str]) -> Optional[int]:
     link_header = headers.get("link")
     if not link_header:
         return None
@@ -879,7 +1024,7 @@ def search_items(
     sort: str,
     start: int,
     tags: Optional[List[str]],
-) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+) -> Tuple[List[Dict[str, Any]], Mapping[str, str]]:
     params: List[Tuple[str, str]] = [
         ("q", query),
         ("limit", str(limit)),
@@ -906,7 +1051,7 @@ def get_item_template(*, config: ZoteroConfig, item_type: str) -> Dict[str, Any]
 
 
 def create_item(*, config: ZoteroConfig, item: Dict[str, Any]) -> Dict[str, Any]:
-    body = json.dumps([item]).encode("utf-8")
+    body = _json_dumps([item])
     path = f"/users/{urllib.parse.quote(config.user_id)}/items"
     data, _ = _request_json_any(
         config=config,
@@ -927,7 +1072,7 @@ def get_item(
     *,
     config: ZoteroConfig,
     item_key: str,
-) -> Tuple[Dict[str, Any], Dict[str, str]]:
+) -> Tuple[Dict[str, Any], Mapping[str, str]]:
     path = f"/users/{urllib.parse.quote(config.user_id)}/items/{urllib.parse.quote(item_key)}"
     return _request_json_object(config=config, method="GET", path=path)
 
@@ -936,7 +1081,7 @@ def list_item_children(
     *,
     config: ZoteroConfig,
     item_key: str,
-) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+) -> Tuple[List[Dict[str, Any]], Mapping[str, str]]:
     path = f"/users/{urllib.parse.quote(config.user_id)}/items/{urllib.parse.quote(item_key)}/children"
     return _request_json(config=config, method="GET", path=path)
 
@@ -946,7 +1091,7 @@ def list_collections(
     config: ZoteroConfig,
     limit: int,
     start: int,
-) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+) -> Tuple[List[Dict[str, Any]], Mapping[str, str]]:
     params: List[Tuple[str, str]] = [
         ("limit", str(limit)),
     ]
@@ -961,7 +1106,7 @@ def add_item_to_collection(
     config: ZoteroConfig,
     collection_key: str,
     item_key: str,
-) -> Tuple[Any, Dict[str, str]]:
+) -> Tuple[Any, Mapping[str, str]]:
     path = (
         f"/users/{urllib.parse.quote(config.user_id)}/collections/{urllib.parse.quote(collection_key)}/items"
     )
@@ -985,10 +1130,11 @@ def _extract_created_key(payload: Any) -> Tuple[str, int]:
     if not isinstance(payload, dict):
         raise ZoteroError("ZOTERO_UPSTREAM_ERROR", "Unexpected Zotero create response.", {"type": type(payload).__name__})
     successful = payload.get("successful")
-    if isinstance(successful, dict):
-        for entry in successful.values():
-            if isinstance(entry, dict) and entry.get("key"):
-                return str(entry["key"]), int(entry.get("version", 0))
+    # Attachments are created one at a time, so the only entry is the new item.
+    if isinstance(successful, dict) and successful:
+        entry = next(iter(successful.values()))
+        if isinstance(entry, dict) and (key := entry.get("key")):
+            return str(key), int(entry.get("version", 0))
     raise ZoteroError("ZOTERO_UPSTREAM_ERROR", "Zotero create failed.", {"response": payload})
 
 
@@ -1006,7 +1152,7 @@ def _upload_multipart(
         headers["Content-Type"] = content_type
     request = urllib.request.Request(url=upload_url, method="POST", headers=headers, data=data)
     try:
-        with urllib.request.urlopen(request, timeout=60) as response:
+        with _open_keepalive(request, timeout=60) as response:
             if response.status < 200 or response.status >= 300:
                 payload = response.read().decode("utf-8")
                 _raise_for_http_error(response.status, payload, response.headers)
@@ -1040,12 +1186,12 @@ def upload_attachment(
     resolved_mtime = time.time()
     size = 0
     if file_path:
-        stat = validate_upload_file(file_path)
+        file_stat = validate_upload_file(file_path)
         resolved_filename = os.path.basename(file_path)
         with open(file_path, "rb") as handle:
             file_bytes = handle.read()
-        size = stat.st_size
-        resolved_mtime = stat.st_mtime
+        size = file_stat.st_size
+        resolved_mtime = file_stat.st_mtime
     elif file_url:
         downloaded_bytes, inferred_filename, inferred_content_type = _download_file_bytes(file_url)
         file_bytes = downloaded_bytes
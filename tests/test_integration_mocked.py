@@ -14,6 +14,7 @@ SRC = os.path.join(ROOT, "src")
 if SRC not in sys.path:
     sys.path.insert(0, SRC)
 
+from zotero_mcp import server
 from zotero_mcp.server import call_tool
 
 
@@ -28,8 +29,14 @@ class FakeResponse:
         else:
             self._body = json.dumps(body).encode("utf-8")
 
-    def read(self) -> bytes:
-        return self._body
+        self._offset = 0
+
+    def read(self, amt: Any = None) -> bytes:
+        if amt is None:
+            return self._body
+        chunk = self._body[self._offset : self._offset + amt]
+        self._offset += len(chunk)
+        return chunk
 
     def __enter__(self) -> "FakeResponse":
         return self
@@ -373,6 +380,121 @@ class IntegrationMockedTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(data["item_key"], "ITEM1")
         self.assertEqual(data["collection_key"], "COL1")
 
+    async def test_add_item_to_collection_by_name_fetches_remaining_pages(self) -> None:
+        api_base = "https://example.test"
+        collections_url = f"{api_base}/users/12345/collections?limit=100"
+        add_url = f"{api_base}/users/12345/collections/COL9/items"
+        headers = {
+            "total-results": "250",
+            "link": f"<{api_base}/users/12345/collections?limit=100&start=100>; rel=\"next\"",
+        }
+        router = RequestRouter(
+            {
+                ("GET", collections_url): FakeResponse(200, headers, [{"key": "COL1", "data": {"name": "Inbox"}}]),
+                ("GET", f"{collections_url}&start=100"): FakeResponse(200, {}, [{"key": "COL2", "data": {"name": "A"}}]),
+                ("GET", f"{collections_url}&start=200"): FakeResponse(200, {}, [{"key": "COL9", "data": {"name": "Reading"}}]),
+                ("POST", add_url): FakeResponse(200, {}, {"successful": True}),
+            }
+        )
+        with patch.dict(os.environ, _default_env(api_base)):
+            with patch("urllib.request.urlopen", new=router):
+                response = await call_tool(
+                    "zotero_add_item_to_collection",
+                    {"item_key": "ITEM1", "collection_name": "reading"},
+                )
+
+        self.assertTrue(response["ok"])
+        self.assertEqual(response["data"]["collection_key"], "COL9")
+
+    async def test_add_item_to_collection_ambiguous_name_stops_paging(self) -> None:
+        api_base = "https://example.test"
+        collections_url = f"{api_base}/users/12345/collections?limit=100"
+        collections = [
+            {"key": "COL3", "data": {"name": "reading"}},
+            {"key": "COL1", "data": {"name": "Reading"}},
+        ]
+        headers = {"link": f"<{api_base}/users/12345/collections?limit=100&start=100>; rel=\"next\""}
+        router = RequestRouter(
+            {
+                ("GET", collections_url): FakeResponse(200, headers, collections),
+            }
+        )
+        with patch.dict(os.environ, _default_env(api_base)):
+            with patch("urllib.request.urlopen", new=router):
+                response = await call_tool(
+                    "zotero_add_item_to_collection",
+                    {"item_key": "ITEM1", "collection_name": "Reading"},
+                )
+
+        self.assertFalse(response["ok"])
+        self.assertEqual(response["error"]["code"], "ZOTERO_AMBIGUOUS_COLLECTION")
+        self.assertEqual(response["error"]["details"]["matches"], ["COL1", "COL3"])
+
+    async def test_input_schema_rejects_unknown_arguments(self) -> None:
+        response = await call_tool("zotero_list_collections", {"limit": 5, "bogus": True})
+        self.assertFalse(response["ok"])
+        self.assertEqual(response["error"]["code"], "ZOTERO_VALIDATION_ERROR")
+        self.assertIn("bogus", response["error"]["message"])
+
+    async def test_oversized_int_argument_is_logged_and_rejected(self) -> None:
+        with self.assertLogs("zotero_mcp", level="INFO") as captured:
+            response = await call_tool("zotero_list_collections", {"limit": 10**30})
+        self.assertFalse(response["ok"])
+        self.assertEqual(response["error"]["code"], "ZOTERO_VALIDATION_ERROR")
+        self.assertEqual(json.loads(captured.records[0].getMessage())["args"], {"limit": 10**30})
+
+    async def test_batch_execute_returns_envelope_per_operation(self) -> None:
+        response = await call_tool(
+            "zotero_batch_execute",
+            {
+                "operations": [
+                    {"tool": "zotero_get_sort_values"},
+                    {"tool": "zotero_get_item", "arguments": {}},
+                    {"tool": "zotero_get_sort_values", "arguments": {}},
+                ],
+            },
+        )
+        self.assertTrue(response["ok"])
+        results = response["data"]["results"]
+        self.assertEqual([result["ok"] for result in results], [True, False, True])
+        self.assertEqual(results[0]["data"]["default"], "relevance")
+        self.assertEqual(results[1]["error"]["code"], "ZOTERO_VALIDATION_ERROR")
+
+    async def test_batch_execute_stop_on_error_skips_remaining(self) -> None:
+        response = await call_tool(
+            "zotero_batch_execute",
+            {
+                "operations": [
+                    {"tool": "zotero_get_item", "arguments": {}},
+                    {"tool": "zotero_get_sort_values"},
+                ],
+                "max_concurrent": 1,
+                "stop_on_error": True,
+            },
+        )
+        results = response["data"]["results"]
+        self.assertEqual(results[0]["error"]["code"], "ZOTERO_VALIDATION_ERROR")
+        self.assertEqual(results[1]["error"]["code"], "ZOTERO_BATCH_SKIPPED")
+
+    async def test_batch_execute_isolates_unexpected_errors(self) -> None:
+        async def fail(validated: Dict[str, Any]) -> Dict[str, Any]:
+            raise TimeoutError("boom")
+
+        with patch.dict(server._TOOL_HANDLERS, {"zotero_list_collections": fail}):
+            response = await call_tool(
+                "zotero_batch_execute",
+                {
+                    "operations": [
+                        {"tool": "zotero_list_collections", "arguments": {}},
+                        {"tool": "zotero_get_sort_values"},
+                    ],
+                },
+            )
+        results = response["data"]["results"]
+        self.assertEqual(results[0]["error"]["code"], "ZOTERO_INTERNAL_ERROR")
+        self.assertEqual(results[0]["error"]["details"], {"type": "TimeoutError"})
+        self.assertTrue(results[1]["ok"])
+
     async def test_get_sort_values(self) -> None:
         response = await call_tool("zotero_get_sort_values", {})
         self.assertTrue(response["ok"])
@@ -380,6 +502,28 @@ class IntegrationMockedTests(unittest.IsolatedAsyncioTestCase):
         self.assertIn("relevance", data["values"])
         self.assertEqual(data["default"], "relevance")
         self.assertEqual(data["fallback"], "dateModified")
+        data["values"].clear()
+        again = await call_tool("zotero_get_sort_values", {})
+        self.assertIn("relevance", again["data"]["values"])
+
+    async def test_tool_call_logs_span_with_shared_correlation_id(self) -> None:
+        with self.assertLogs("zotero_mcp", level="INFO") as captured:
+            response = await call_tool("zotero_get_sort_values", {})
+        self.assertTrue(response["ok"])
+        events = [json.loads(record.getMessage()) for record in captured.records]
+        self.assertEqual([event["event"] for event in events], ["tool.call", "tool.success"])
+        self.assertEqual(events[0]["correlation_id"], events[1]["correlation_id"])
+        with self.assertLogs("zotero_mcp", level="INFO") as captured:
+            await call_tool("zotero_get_sort_values", {})
+        self.assertNotEqual(json.loads(captured.records[0].getMessage())["correlation_id"], events[0]["correlation_id"])
+
+    async def test_tool_error_is_logged_and_returned(self) -> None:
+        with self.assertLogs("zotero_mcp", level="INFO") as captured:
+            response = await call_tool("zotero_get_item", {})
+        self.assertFalse(response["ok"])
+        self.assertEqual(response["error"]["code"], "ZOTERO_VALIDATION_ERROR")
+        events = [json.loads(record.getMessage()) for record in captured.records]
+        self.assertEqual([event["event"] for event in events], ["tool.call", "tool.error"])
 
 
 if __name__ == "__main__":
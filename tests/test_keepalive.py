@@ -0,0 +1,147 @@
+import http.server
+import os
+import sys
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from zotero_mcp import zotero_client
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Closes the socket without announcing it, like a server dropping an idle connection.
+    close_after_response = False
+
+    def do_GET(self) -> None:
+        self.server.peers.add(self.client_address)
+        body = b"x" * 64
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.close_connection = self.close_after_response
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", "0")))
+        self.do_GET()
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+def _serve():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.peers = set()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    return httpd
+
+
+def test_keepalive_handler_reuses_connection():
+    httpd = _serve()
+    try:
+        opener = urllib.request.build_opener(zotero_client._KeepAliveHTTPHandler())
+        url = f"http://127.0.0.1:{httpd.server_port}/items"
+        for _ in range(3):
+            with opener.open(url, timeout=5) as response:
+                assert response.read() == b"x" * 64
+        assert len(httpd.peers) == 1
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_keepalive_handler_drops_partially_read_connection():
+    httpd = _serve()
+    try:
+        opener = urllib.request.build_opener(zotero_client._KeepAliveHTTPHandler())
+        url = f"http://127.0.0.1:{httpd.server_port}/items"
+        with opener.open(url, timeout=5) as response:
+            assert response.read(8) == b"x" * 8
+        with opener.open(url, timeout=5) as response:
+            assert response.read() == b"x" * 64
+        assert len(httpd.peers) == 2
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_keepalive_handler_retries_when_idle_connection_was_dropped():
+    httpd = _serve()
+    try:
+        opener = urllib.request.build_opener(zotero_client._KeepAliveHTTPHandler())
+        url = f"http://127.0.0.1:{httpd.server_port}/items"
+        _Handler.close_after_response = True
+        with opener.open(url, timeout=5) as response:
+            response.read()
+        _Handler.close_after_response = False
+        with opener.open(url, timeout=5) as response:
+            assert response.read() == b"x" * 64
+        assert len(httpd.peers) == 2
+    finally:
+        _Handler.close_after_response = False
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_keepalive_handler_reuses_connection_with_default_timeout():
+    httpd = _serve()
+    try:
+        opener = urllib.request.build_opener(zotero_client._KeepAliveHTTPHandler())
+        url = f"http://127.0.0.1:{httpd.server_port}/items"
+        for _ in range(2):
+            with opener.open(url) as response:
+                assert response.read() == b"x" * 64
+        assert len(httpd.peers) == 1
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_keepalive_handler_does_not_resend_post_on_stale_connection():
+    httpd = _serve()
+    try:
+        opener = urllib.request.build_opener(zotero_client._KeepAliveHTTPHandler())
+        url = f"http://127.0.0.1:{httpd.server_port}/items"
+        _Handler.close_after_response = True
+        with opener.open(url, timeout=5) as response:
+            response.read()
+        _Handler.close_after_response = False
+        with pytest.raises(urllib.error.URLError):
+            opener.open(url, data=b"{}", timeout=5)
+        assert len(httpd.peers) == 1
+    finally:
+        _Handler.close_after_response = False
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_keepalive_handler_closes_idle_connections(monkeypatch):
+    monkeypatch.setattr(zotero_client, "_KEEPALIVE_IDLE_SECONDS", -1.0)
+    httpd = _serve()
+    try:
+        opener = urllib.request.build_opener(zotero_client._KeepAliveHTTPHandler())
+        url = f"http://127.0.0.1:{httpd.server_port}/items"
+        for _ in range(2):
+            with opener.open(url, timeout=5) as response:
+                response.read()
+        assert len(httpd.peers) == 2
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_install_keepalive_opener_leaves_global_opener_alone(monkeypatch):
+    monkeypatch.setattr(zotero_client, "_keepalive_opener", None)
+    monkeypatch.setattr(urllib.request, "_opener", None)
+    zotero_client.install_keepalive_opener()
+    assert urllib.request._opener is None
+    assert zotero_client._keepalive_opener is not None
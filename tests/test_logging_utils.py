@@ -0,0 +1,198 @@
+import asyncio
+import io
+import json
+import logging
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC = os.path.join(ROOT, "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from zotero_mcp import logging_utils
+from zotero_mcp.logging_utils import REDACTED
+
+
+def test_redact_sensitive_keys_and_secrets():
+    payload = {
+        "api_key": "abc",
+        "Zotero-API-Key": "abc",
+        "File Path": "/tmp/file.pdf",
+        "tool": "zotero_get_item",
+        "nested": {"token": "t", "value": "s3cret", "count": 2},
+    }
+    redacted = logging_utils.redact(payload, secrets=["s3cret"])
+    assert redacted == {
+        "api_key": REDACTED,
+        "Zotero-API-Key": REDACTED,
+        "File Path": REDACTED,
+        "tool": "zotero_get_item",
+        "nested": {"token": REDACTED, "value": REDACTED, "count": 2},
+    }
+
+
+def test_redact_preserves_container_types_and_order():
+    payload = {
+        "b": [1, ("x", "s3cret"), {"password": "p"}],
+        "a": {"s3cret", "ok"},
+        1: None,
+    }
+    redacted = logging_utils.redact(payload, secrets=["s3cret"])
+    assert list(redacted) == ["b", "a", "1"]
+    assert redacted["b"] == [1, ("x", REDACTED), {"password": REDACTED}]
+    assert isinstance(redacted["b"][1], tuple)
+    assert redacted["a"] == {REDACTED, "ok"}
+    assert redacted["1"] is None
+
+
+def test_redact_does_not_mutate_input():
+    payload = {"args": {"file_path": "/tmp/a.pdf", "tags": ["a"]}}
+    logging_utils.redact(payload)
+    assert payload == {"args": {"file_path": "/tmp/a.pdf", "tags": ["a"]}}
+
+
+def test_redact_scalars_pass_through():
+    assert logging_utils.redact("s3cret", secrets=["s3cret"]) == REDACTED
+    assert logging_utils.redact(42) == 42
+    assert logging_utils.redact(None) is None
+
+
+def test_log_event_skips_disabled_levels(monkeypatch):
+    logger = logging.getLogger("zotero_mcp.tests.disabled")
+    logger.setLevel(logging.WARNING)
+    calls = []
+    monkeypatch.setattr(logging_utils, "redact", lambda *args, **kwargs: calls.append(args))
+    logging_utils.log_event(logger, level=logging.DEBUG, event="test.debug", value=1)
+    assert calls == []
+
+
+def test_needs_redaction_detects_sensitive_content():
+    secrets = frozenset({"s3cret"})
+    assert not logging_utils._needs_redaction({"event": "tool.call", "args": {"limit": 5}}, secrets)
+    assert logging_utils._needs_redaction({"args": {"file_path": "/tmp/a.pdf"}}, secrets)
+    assert logging_utils._needs_redaction({"args": ["s3cret"]}, secrets)
+    assert logging_utils._needs_redaction({"args": {1: "x"}}, secrets)
+    assert logging_utils._needs_redaction({"args": {"x", "y"}}, secrets)
+
+
+def test_log_event_emits_single_json_line(caplog):
+    logger = logging.getLogger("zotero_mcp.tests.emit")
+    logger.setLevel(logging.INFO)
+    with caplog.at_level(logging.INFO, logger="zotero_mcp.tests.emit"):
+        logging_utils.log_event(logger, level=logging.INFO, event="test.emit", token="t", count=2)
+    payload = json.loads(caplog.records[-1].getMessage())
+    assert payload["service"] == "zotero-mcp"
+    assert payload["event"] == "test.emit"
+    assert payload["level"] == "INFO"
+    assert payload["token"] == REDACTED
+    assert payload["count"] == 2
+
+
+def test_log_event_raw_skips_redaction(caplog, monkeypatch):
+    logger = logging.getLogger("zotero_mcp.tests.raw")
+    logger.setLevel(logging.INFO)
+    calls = []
+    monkeypatch.setattr(logging_utils, "redact", lambda *args, **kwargs: calls.append(args))
+    with caplog.at_level(logging.INFO, logger="zotero_mcp.tests.raw"):
+        logging_utils.log_event_raw(logger, level=logging.INFO, event="test.raw", version="1.0", count=3)
+    payload = json.loads(caplog.records[-1].getMessage())
+    assert calls == []
+    assert payload["event"] == "test.raw"
+    assert payload["version"] == "1.0"
+    assert payload["count"] == 3
+
+
+def test_correlation_id_scope_with_and_without_event_loop(caplog):
+    logger = logging.getLogger("zotero_mcp.tests.correlation")
+    logger.setLevel(logging.INFO)
+
+    def emit(event):
+        logging_utils.log_event(logger, level=logging.INFO, event=event)
+        return json.loads(caplog.records[-1].getMessage())
+
+    async def in_loop():
+        with logging_utils.correlation_id_scope("async-id"):
+            return emit("test.async")
+
+    with caplog.at_level(logging.INFO, logger="zotero_mcp.tests.correlation"):
+        with logging_utils.correlation_id_scope("sync-id"):
+            assert emit("test.sync")["correlation_id"] == "sync-id"
+        assert "correlation_id" not in emit("test.after")
+        assert asyncio.run(in_loop())["correlation_id"] == "async-id"
+        assert "correlation_id" not in emit("test.after_async")
+
+
+def test_sensitive_key_variants():
+    payload = {"api-key": "a", "file path": "b", "Set_Cookie": "c", "tool": "d", "__": "e"}
+    assert logging_utils.redact(payload) == {
+        "api-key": REDACTED,
+        "file path": REDACTED,
+        "Set_Cookie": REDACTED,
+        "tool": "d",
+        "__": "e",
+    }
+
+
+def test_json_line_handler_writes_encoded_line():
+    stream = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    handler = logging_utils._JSONLineHandler(stream=stream)
+    record = logging.LogRecord("zotero_mcp", logging.INFO, __file__, 1, '{"event":"é"}', None, None)
+    handler.emit(record)
+    assert stream.buffer.getvalue() == '{"event":"é"}\n'.encode("utf-8")
+
+
+def test_elide_long_strings_copies_only_changed_containers():
+    short = {"query": "graph", "tags": ["a", "b"]}
+    assert logging_utils.elide_long_strings(short) is short
+    payload = {"abstract": "x" * 20, "tags": ["a", "y" * 11], "limit": 5}
+    elided = logging_utils.elide_long_strings(payload, max_chars=10)
+    assert elided == {"abstract": "<20 chars elided>", "tags": ["a", "<11 chars elided>"], "limit": 5}
+    assert payload["abstract"] == "x" * 20
+
+
+def test_dumps_falls_back_for_values_orjson_rejects(monkeypatch):
+    for orjson_module in (logging_utils.orjson, None):
+        monkeypatch.setattr(logging_utils, "orjson", orjson_module)
+        assert json.loads(logging_utils._dumps({"limit": 10**30})) == {"limit": 10**30}
+
+
+def test_configure_logging_replaces_previous_listener(monkeypatch):
+    logger = logging.getLogger(logging_utils.LOGGER_NAME)
+    monkeypatch.setattr(logger, "handlers", list(logger.handlers))
+    monkeypatch.setattr(logger, "propagate", logger.propagate)
+    monkeypatch.setattr(logger, "level", logger.level)
+    monkeypatch.setattr(logger, "_configured", False, raising=False)
+    logging_utils.configure_logging()
+    first = logging_utils._listener
+    logger._configured = False
+    logging_utils.configure_logging()
+    second = logging_utils._listener
+    assert first is not second
+    assert first._thread is None
+    logging_utils._stop_listener()
+    assert logging_utils._listener is None
+
+
+def test_log_event_raw_encodes_one_object_per_line(caplog):
+    logger = logging.getLogger("zotero_mcp.tests.line")
+    logger.setLevel(logging.INFO)
+    with caplog.at_level(logging.INFO, logger="zotero_mcp.tests.line"):
+        logging_utils.log_event_raw(logger, level=logging.INFO, event="test.line", service="other")
+    message = caplog.records[-1].getMessage()
+    assert message.count('"service"') == 1
+    assert json.loads(message)["event"] == "test.line"
+
+
+def test_task_correlation_id_wins_over_thread_local(caplog):
+    logger = logging.getLogger("zotero_mcp.tests.precedence")
+    logger.setLevel(logging.INFO)
+
+    async def in_loop():
+        with logging_utils.correlation_id_scope("task-id"):
+            logging_utils.log_event(logger, level=logging.INFO, event="test.precedence")
+
+    with caplog.at_level(logging.INFO, logger="zotero_mcp.tests.precedence"):
+        with logging_utils.correlation_id_scope("stale-thread-id"):
+            asyncio.run(in_loop())
+    assert json.loads(caplog.records[-1].getMessage())["correlation_id"] == "task-id"
@@ -1,12 +1,18 @@
+import email
+import http.client
+import io
 import os
 import sys
 
+import pytest
+
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 SRC = os.path.join(ROOT, "src")
 if SRC not in sys.path:
     sys.path.insert(0, SRC)
 
 from zotero_mcp import zotero_client
+from zotero_mcp.zotero_client import ZoteroError
 
 
 def test_extract_exact_doi_query_accepts_known_forms():
@@ -39,3 +45,133 @@ def test_extract_exact_arxiv_query_accepts_known_forms():
 def test_extract_exact_arxiv_query_rejects_non_exact():
     assert zotero_client.extract_exact_arxiv_query("see arXiv:1707.12345") is None
     assert zotero_client.extract_exact_arxiv_query("1707.12345 extra") is None
+
+
+def test_load_config_from_env_reuses_config_until_env_changes(monkeypatch):
+    monkeypatch.setenv("ZOTERO_API_KEY", "key")
+    monkeypatch.setenv("ZOTERO_USER_ID", "1")
+    monkeypatch.setenv("ZOTERO_API_BASE", "https://example.test/")
+    first = zotero_client.load_config_from_env()
+    assert first is zotero_client.load_config_from_env()
+    assert first.api_base == "https://example.test"
+    monkeypatch.setenv("ZOTERO_USER_ID", "2")
+    assert zotero_client.load_config_from_env().user_id == "2"
+
+
+def test_env_tuning_configs_reparse_only_when_env_changes(monkeypatch):
+    monkeypatch.setenv("ZOTERO_RETRY_MAX_ATTEMPTS", "5")
+    monkeypatch.setenv("ZOTERO_READ_CACHE", "1")
+    monkeypatch.setenv("ZOTERO_UPLOAD_MAX_BYTES", "1024")
+    retry = zotero_client._load_retry_config()
+    assert retry is zotero_client._load_retry_config()
+    assert retry.max_attempts == 5
+    assert zotero_client._load_read_cache_config().enabled is True
+    assert zotero_client.load_upload_max_bytes() == 1024
+    monkeypatch.setenv("ZOTERO_RETRY_MAX_ATTEMPTS", "0")
+    monkeypatch.setenv("ZOTERO_READ_CACHE", "0")
+    monkeypatch.setenv("ZOTERO_UPLOAD_MAX_BYTES", "nope")
+    assert zotero_client._load_retry_config().max_attempts == 1
+    assert zotero_client._load_read_cache_config().enabled is False
+    assert zotero_client.load_upload_max_bytes() == zotero_client.DEFAULT_UPLOAD_MAX_BYTES
+
+
+def test_json_helpers_round_trip_with_and_without_orjson(monkeypatch):
+    payload = [{"title": "Café", "version": 3, "tags": []}]
+    for orjson_module in (zotero_client.orjson, None):
+        monkeypatch.setattr(zotero_client, "orjson", orjson_module)
+        encoded = zotero_client._json_dumps(payload)
+        assert isinstance(encoded, bytes)
+        assert zotero_client._json_loads(encoded) == payload
+
+
+def test_infer_content_type_uses_extension():
+    assert zotero_client.infer_content_type("/tmp/Paper.PDF") == "application/pdf"
+    assert zotero_client.infer_content_type("notes.txt") == "text/plain"
+    assert zotero_client.infer_content_type("book.epub") == "application/epub+zip"
+    assert zotero_client.infer_content_type("archive.unknownext") == "application/octet-stream"
+    assert zotero_client.infer_content_type("README") == "application/octet-stream"
+
+
+def test_parse_arxiv_id_accepts_new_and_old_style_ids():
+    assert zotero_client.parse_arxiv_id("2101.00001") == ("2101.00001", None)
+    assert zotero_client.parse_arxiv_id("hep-th/9901001v2") == ("hep-th/9901001", "v2")
+    assert zotero_client.parse_arxiv_id("https://arxiv.org/abs/2101.00001v3") == ("2101.00001", "v3")
+    assert zotero_client.parse_arxiv_id("not-an-id") is None
+
+
+def test_filter_items_exact_match_reads_ids_from_extra():
+    items = [
+        {"key": "A", "data": {"extra": "arXiv: 2101.00001v1\nDOI: 10.1000/XYZ"}},
+        {"key": "B", "data": {"extra": "DOI: 10.1000/other"}},
+    ]
+    assert [item["key"] for item in zotero_client.filter_items_exact_match(items, arxiv_id="2101.00001")] == ["A"]
+    assert [item["key"] for item in zotero_client.filter_items_exact_match(items, doi="10.1000/xyz")] == ["A"]
+    assert zotero_client.filter_items_exact_match(items, doi="2101.00001v1") == []
+
+
+def test_filter_items_exact_match_accepts_prefixed_fields():
+    items = [
+        {"key": "A", "data": {"DOI": " https://doi.org/10.1000/XYZ ", "archiveID": "arXiv:2101.00001v2"}},
+        {"key": "B", "data": {"DOI": "10.1000/xyz2", "archiveID": "arXiv:2101.000011"}},
+        {"key": "C", "data": None},
+    ]
+    assert [item["key"] for item in zotero_client.filter_items_exact_match(items, doi="10.1000/xyz")] == ["A"]
+    assert [item["key"] for item in zotero_client.filter_items_exact_match(items, arxiv_id="2101.00001v2")] == ["A"]
+
+
+def test_write_pdf_response_to_temp_streams_and_cleans_up(monkeypatch, tmp_path):
+    monkeypatch.setattr(zotero_client.tempfile, "tempdir", str(tmp_path))
+    path = zotero_client._write_pdf_response_to_temp(io.BytesIO(b"%PDF-1.7 body"), "")
+    with open(path, "rb") as handle:
+        assert handle.read() == b"%PDF-1.7 body"
+    os.unlink(path)
+
+    monkeypatch.setenv("ZOTERO_UPLOAD_MAX_BYTES", "4")
+    with pytest.raises(ZoteroError, match="exceeds upload size limit"):
+        zotero_client._write_pdf_response_to_temp(io.BytesIO(b"%PDF-1.7 body"), "application/pdf")
+    monkeypatch.delenv("ZOTERO_UPLOAD_MAX_BYTES")
+    with pytest.raises(ZoteroError, match="not a PDF"):
+        zotero_client._write_pdf_response_to_temp(io.BytesIO(b"<html>"), "text/html")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_read_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(zotero_client, "_READ_CACHE", zotero_client.OrderedDict())
+    config = zotero_client.ReadCacheConfig(enabled=True, ttl_seconds=30.0, max_entries=2)
+    zotero_client._store_cached_response("a", 1, {}, config)
+    zotero_client._store_cached_response("b", 2, {}, config)
+    assert zotero_client._get_cached_response("a", config) == (1, {})
+    zotero_client._store_cached_response("c", 3, {}, config)
+    assert zotero_client._get_cached_response("b", config) is None
+    assert zotero_client._get_cached_response("a", config) == (1, {})
+    assert zotero_client._get_cached_response("c", config) == (3, {})
+
+
+def test_read_cache_drops_expired_entries(monkeypatch):
+    monkeypatch.setattr(zotero_client, "_READ_CACHE", zotero_client.OrderedDict())
+    config = zotero_client.ReadCacheConfig(enabled=True, ttl_seconds=30.0, max_entries=2)
+    zotero_client._store_cached_response("a", 1, {"x": "1"}, config)
+    real_monotonic = zotero_client.time.monotonic
+    monkeypatch.setattr(zotero_client.time, "monotonic", lambda: real_monotonic() + 31)
+    assert zotero_client._get_cached_response("a", config) is None
+    assert "a" not in zotero_client._READ_CACHE
+
+
+def test_filename_from_content_disposition():
+    parse = zotero_client._filename_from_content_disposition
+    assert parse('attachment; filename="paper.pdf"') == "paper.pdf"
+    assert parse("attachment; FILENAME*=UTF-8''O'Brien%20notes.pdf") == "O'Brien%20notes.pdf"
+    assert parse('attachment; filename=""; filename*=utf-8\'\'b.pdf') == "b.pdf"
+    assert parse("attachment; myfilename=a.pdf") is None
+    assert parse(None) is None
+
+
+def test_response_headers_view_is_case_insensitive():
+    raw = "Total-Results: 7\r\nLink: <x?start=5>; rel=\"next\"\r\n\r\n"
+    message = email.message_from_string(raw, _class=http.client.HTTPMessage)
+    headers = zotero_client._ResponseHeaders(message, 200)
+    assert headers["status"] == "200"
+    assert zotero_client.parse_total_results(headers) == 7
+    assert zotero_client.parse_next_start(headers) == 5
+    assert "retry-after" not in headers
+    assert dict(headers) == {"status": "200", "total-results": "7", "link": "<x?start=5>; rel=\"next\""}
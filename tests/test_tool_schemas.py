@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 
@@ -27,6 +28,7 @@ def test_tool_list_names():
         "zotero_upload_attachment",
         "zotero_attach_arxiv_pdf",
         "zotero_add_item_to_collection",
+        "zotero_batch_execute",
     }
 
 
@@ -108,3 +110,20 @@ def test_add_item_to_collection_schema_details():
     assert schema["properties"]["item_key"]["minLength"] == 1
     assert schema["properties"]["collection_key"]["minLength"] == 1
     assert schema["properties"]["collection_name"]["minLength"] == 1
+
+
+def test_list_tools_reuses_cached_definitions():
+    first = asyncio.run(server_module.list_tools())
+    second = asyncio.run(server_module.list_tools())
+    assert first is second
+    assert [tool.name for tool in first] == [tool.name for tool in server_module._tool_list()]
+
+
+def test_every_tool_with_arguments_has_a_validator():
+    names = {tool.name for tool in server_module._tool_list() if tool.inputSchema["properties"]}
+    assert set(server_module._VALIDATORS) == names
+
+
+def test_every_tool_has_a_handler():
+    names = {tool.name for tool in server_module._tool_list()}
+    assert set(server_module._TOOL_HANDLERS) == names
@@ -115,6 +115,27 @@ def test_validate_create_args_creators_name():
     assert validated["creators"] == creators
 
 
+def test_validate_create_args_creators_are_stripped_and_pruned():
+    validated = server_module._validate_create_args(
+        {
+            "item_type": "book",
+            "title": "Title",
+            "creators": [
+                {"creator_type": " author ", "name": " ", "first_name": " Ada ", "last_name": 7},
+                {"creator_type": "editor", "name": " Babbage ", "first_name": "Charles"},
+            ],
+        }
+    )
+    assert validated["creators"] == [
+        {"creator_type": "author", "first_name": "Ada"},
+        {"creator_type": "editor", "name": "Babbage"},
+    ]
+    assert server_module._serialize_creators(validated["creators"]) == [
+        {"creatorType": "author", "firstName": "Ada"},
+        {"creatorType": "editor", "name": "Babbage"},
+    ]
+
+
 def test_validate_create_args_creators_first_last():
     creators = [{"creator_type": "author", "first_name": "Ada", "last_name": "Lovelace"}]
     validated = server_module._validate_create_args(
@@ -180,6 +201,8 @@ def test_validate_upload_attachment_args_defaults(tmp_path):
         ({"item_key": "ABC"}, "Provide exactly one of file_path, file_url, or file_bytes_base64."),
         ({"item_key": "ABC", "file_path": ""}, "file_path must be a non-empty string when provided."),
         ({"item_key": "ABC", "file_url": "ftp://example.com/file.pdf"}, "file_url must be http or https."),
+        ({"item_key": "ABC", "file_url": "https:///file.pdf"}, "file_url must include a host."),
+        ({"item_key": "ABC", "file_url": "http://?x=1"}, "file_url must include a host."),
         (
             {"item_key": "ABC", "file_path": "FILE_PATH", "title": ""},
             "title must be a non-empty string when provided.",
@@ -192,10 +215,18 @@ def test_validate_upload_attachment_args_defaults(tmp_path):
             {"item_key": "ABC", "file_bytes_base64": "Zm9v"},
             "filename is required when using file_bytes_base64.",
         ),
+        (
+            {"item_key": "ABC", "file_bytes_base64": "NOT_BASE64"},
+            "filename is required when using file_bytes_base64.",
+        ),
         (
             {"item_key": "ABC", "file_bytes_base64": "NOT_BASE64", "filename": "file.pdf"},
             "file_bytes_base64 must be valid base64.",
         ),
+        (
+            {"item_key": "ABC", "file_bytes_base64": "Zm9vé", "filename": "file.pdf"},
+            "file_bytes_base64 must be valid base64.",
+        ),
     ],
 )
 def test_validate_upload_attachment_args_errors(args, message, tmp_path):
@@ -217,6 +248,13 @@ def test_validate_upload_attachment_args_missing_file():
     assert excinfo.value.message == "file_path does not exist."
 
 
+def test_validate_upload_attachment_args_rejects_directory(tmp_path):
+    with pytest.raises(ZoteroError) as excinfo:
+        server_module._validate_upload_attachment_args({"item_key": "ABC", "file_path": str(tmp_path)})
+    assert excinfo.value.code == "ZOTERO_VALIDATION_ERROR"
+    assert excinfo.value.message == "file_path must point to a local file."
+
+
 def test_validate_upload_attachment_args_size_limit(tmp_path, monkeypatch):
     file_path = tmp_path / "big.pdf"
     file_path.write_bytes(b"a" * 10)
@@ -227,6 +265,33 @@ def test_validate_upload_attachment_args_size_limit(tmp_path, monkeypatch):
     assert excinfo.value.message == "file_path exceeds upload size limit."
 
 
+def test_validate_upload_attachment_args_base64_size_limit(monkeypatch):
+    monkeypatch.setenv("ZOTERO_UPLOAD_MAX_BYTES", "5")
+    args = {"item_key": "ABC", "filename": "file.pdf"}
+    # Exactly at the limit: 5 bytes encode to 8 characters with one padding byte.
+    validated = server_module._validate_upload_attachment_args(dict(args, file_bytes_base64="aGVsbG8="))
+    assert validated["file_bytes"] == b"hello"
+    # Oversized payloads are rejected from their length before the content is decoded.
+    with pytest.raises(ZoteroError) as excinfo:
+        server_module._validate_upload_attachment_args(dict(args, file_bytes_base64="!" * 12))
+    assert excinfo.value.message == "file_bytes exceeds upload size limit."
+    assert excinfo.value.details == {"size": 9, "max_bytes": 5}
+
+
+def test_validate_upload_attachment_args_base64_size_ignores_surplus_padding(monkeypatch):
+    monkeypatch.setenv("ZOTERO_UPLOAD_MAX_BYTES", "3")
+    monkeypatch.setattr(server_module, "pybase64", None)
+    args = {"item_key": "ABC", "filename": "file.pdf", "file_bytes_base64": "Zm9v===="}
+    assert server_module._validate_upload_attachment_args(args)["file_bytes"] == b"foo"
+
+
+def test_validate_upload_attachment_args_accepts_mixed_case_url_scheme():
+    validated = server_module._validate_upload_attachment_args(
+        {"item_key": "ABC", "file_url": " HTTPS://example.com/paper.pdf "}
+    )
+    assert validated["file_url"] == "HTTPS://example.com/paper.pdf"
+
+
 def test_validate_upload_attachment_args_blank_content_type(tmp_path):
     file_path = tmp_path / "file.pdf"
     file_path.write_bytes(b"%PDF-1.4 test")
@@ -299,3 +364,38 @@ def test_validate_add_item_to_collection_args_errors(args, message):
         server_module._validate_add_item_to_collection_args(args)
     assert excinfo.value.code == "ZOTERO_VALIDATION_ERROR"
     assert excinfo.value.message == message
+
+
+def test_validate_batch_execute_args_defaults():
+    validated = server_module._validate_batch_execute_args({"operations": [{"tool": "zotero_get_sort_values"}]})
+    assert validated == {
+        "operations": [{"tool": "zotero_get_sort_values", "arguments": {}}],
+        "max_concurrent": 5,
+        "stop_on_error": False,
+    }
+
+
+@pytest.mark.parametrize(
+    "args,message",
+    [
+        ({}, "operations must be an array of 1 to 50 tool calls."),
+        ({"operations": []}, "operations must be an array of 1 to 50 tool calls."),
+        ({"operations": ["zotero_get_item"]}, "operations entries must be objects."),
+        ({"operations": [{"tool": "zotero_unknown"}]}, "tool must name a non-batch Zotero tool."),
+        ({"operations": [{"tool": "zotero_batch_execute"}]}, "tool must name a non-batch Zotero tool."),
+        ({"operations": [{"tool": "zotero_get_item", "arguments": []}]}, "arguments must be an object."),
+        (
+            {"operations": [{"tool": "zotero_get_sort_values"}], "max_concurrent": 0},
+            "max_concurrent must be an integer between 1 and 10.",
+        ),
+        (
+            {"operations": [{"tool": "zotero_get_sort_values"}], "stop_on_error": "yes"},
+            "stop_on_error must be a boolean.",
+        ),
+    ],
+)
+def test_validate_batch_execute_args_errors(args, message):
+    with pytest.raises(ZoteroError) as excinfo:
+        server_module._validate_batch_execute_args(args)
+    assert excinfo.value.code == "ZOTERO_VALIDATION_ERROR"
+    assert excinfo.value.message == message